@@ -1,13 +1,25 @@
 from setuptools import setup, find_packages
 from setuptools.command.install import install
 from distutils.cmd import Command
+from functools import lru_cache
 from typing import Dict, Type, cast
-import tomli
 import subprocess
 import sys
 
-with open("pyproject.toml", "rb") as f:
-    pyproject = tomli.load(f)
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib
+
+
+@lru_cache(maxsize=None)
+def _load_pyproject(path: str = "pyproject.toml") -> dict:
+    """Parse pyproject.toml once per process"""
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+pyproject = _load_pyproject()
 
 # Extract version and dependencies from pyproject.toml
 version = pyproject["tool"]["poetry"]["version"]
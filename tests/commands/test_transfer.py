@@ -0,0 +1,48 @@
+from types import SimpleNamespace
+
+import pytest
+from rich.prompt import Prompt
+
+import vana
+from vana.commands.transfer import TransferCommand
+
+
+def _transfer_config() -> vana.Config:
+    config = vana.Config()
+    config.no_prompt = False
+    config.dest = None
+    config.amount = 1.0
+    config.wallet = vana.Config()
+    config.wallet.name = "default"
+    config["__is_set"]["wallet.name"] = True
+    return config
+
+
+class _FakeChainManager:
+    def __init__(self, config):
+        pass
+
+    def get_balance(self, address):
+        return 10
+
+
+def test_check_config_prompts_for_dest(monkeypatch):
+    dest = "0x" + "11" * 20
+    monkeypatch.setattr(Prompt, "ask", lambda *args, **kwargs: dest)
+    monkeypatch.setattr(
+        vana, "Wallet",
+        lambda config: SimpleNamespace(coldkeypub=SimpleNamespace(to_checksum_address=lambda: dest)),
+    )
+    monkeypatch.setattr(vana, "ChainManager", _FakeChainManager)
+
+    config = _transfer_config()
+    TransferCommand.check_config(config)
+
+    assert config.dest == dest
+
+
+def test_check_config_exits_on_invalid_dest(monkeypatch):
+    monkeypatch.setattr(Prompt, "ask", lambda *args, **kwargs: "not-an-address")
+
+    with pytest.raises(SystemExit):
+        TransferCommand.check_config(_transfer_config())
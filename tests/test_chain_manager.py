@@ -0,0 +1,128 @@
+import json
+
+import pytest
+from web3 import HTTPProvider, Web3
+
+from vana import chain_manager as chain_manager_module
+from vana.chain_manager import ChainManager
+
+# value(uint256 id) returns (uint256): the stub node answers id * 10, and reverts for the IDs in _REVERTING.
+_ABI = [{
+    "name": "value",
+    "type": "function",
+    "stateMutability": "view",
+    "inputs": [{"name": "id", "type": "uint256"}],
+    "outputs": [{"name": "", "type": "uint256"}],
+}]
+_ADDRESS = "0x" + "11" * 20
+_REVERTING = {3}
+
+
+class _StubProvider(HTTPProvider):
+    """An HTTPProvider that answers eth_call itself and records every call it is sent on its own."""
+
+    def __init__(self):
+        super().__init__("http://stub.invalid")
+        self.single_calls = []
+
+    @staticmethod
+    def answer(method, params):
+        if method == "eth_chainId":
+            return {"result": "0x1"}
+        if method == "eth_getBalance":
+            return {"result": hex(int(params[0], 16))}
+        file_id = int(params[0]["data"][10:], 16)
+        if file_id in _REVERTING:
+            return {"error": {"code": -32000, "message": "execution reverted"}}
+        return {"result": "0x" + (file_id * 10).to_bytes(32, "big").hex()}
+
+    def make_request(self, method, params):
+        if method != "eth_chainId":
+            self.single_calls.append((method, params))
+        return {"jsonrpc": "2.0", "id": 0, **self.answer(method, params)}
+
+
+@pytest.fixture
+def provider():
+    return _StubProvider()
+
+
+@pytest.fixture
+def batches(monkeypatch, provider):
+    """Answers batched requests through the stub, in reverse order, and records the size of each batch."""
+    sizes = []
+
+    def make_post_request(endpoint_uri, data, **kwargs):
+        payload = json.loads(data)
+        sizes.append(len(payload))
+        responses = [{"jsonrpc": "2.0", "id": call["id"], **provider.answer(call["method"], call["params"])}
+                     for call in payload]
+        return json.dumps(responses[::-1]).encode()
+
+    monkeypatch.setattr(chain_manager_module, "make_post_request", make_post_request)
+    return sizes
+
+
+@pytest.fixture
+def chain_manager(provider):
+    manager = ChainManager.__new__(ChainManager)
+    manager.web3 = Web3(provider)
+    return manager
+
+
+def _functions(chain_manager, ids):
+    contract = chain_manager.web3.eth.contract(address=_ADDRESS, abi=_ABI)
+    return [contract.functions.value(file_id) for file_id in ids]
+
+
+def test_batch_request_returns_results_in_call_order(chain_manager, provider, batches):
+    addresses = ["0x" + f"{i:040x}" for i in (5, 1, 9)]
+    calls = [("eth_getBalance", [address, "latest"]) for address in addresses]
+
+    assert chain_manager.batch_request(calls) == ["0x5", "0x1", "0x9"]
+    assert batches == [3]
+    assert provider.single_calls == []
+
+
+def test_read_contract_fns_decodes_results_in_order(chain_manager, provider, batches):
+    assert chain_manager.read_contract_fns(_functions(chain_manager, [4, 1, 2])) == [40, 10, 20]
+    assert batches == [3]
+    assert provider.single_calls == []
+
+
+def test_read_contract_fns_reports_errors_per_call(chain_manager, provider, batches):
+    assert chain_manager.read_contract_fns(_functions(chain_manager, [1, 3, 2])) == [10, None, 20]
+    # The batch is rejected as a whole, then each function is read on its own.
+    assert batches == [3]
+    assert [params[0]["data"][-1] for _, params in provider.single_calls[-3:]] == ["1", "3", "2"]
+
+
+def test_read_contract_fns_falls_back_when_batch_fails(chain_manager, provider, monkeypatch):
+    def make_post_request(endpoint_uri, data, **kwargs):
+        raise ConnectionError("batch rejected")
+
+    monkeypatch.setattr(chain_manager_module, "make_post_request", make_post_request)
+
+    assert chain_manager.read_contract_fns(_functions(chain_manager, [1, 2, 4])) == [10, 20, 40]
+    assert [params[0]["data"][-1] for _, params in provider.single_calls] == ["1", "2", "4"]
+
+
+def test_batch_reads_resolves_each_future(chain_manager, provider, batches):
+    with chain_manager.batch_reads(max_batch_size=2) as batch:
+        futures = [batch.add(function) for function in _functions(chain_manager, [1, 2, 3])]
+
+    assert [future.result() for future in futures] == [10, 20, None]
+    # The third read is a batch of its own, so it is sent as a single call.
+    assert batches == [2]
+    assert len(provider.single_calls) == 1
+
+
+def test_batch_reads_sends_nothing_when_block_raises(chain_manager, provider, batches):
+    with pytest.raises(RuntimeError):
+        with chain_manager.batch_reads() as batch:
+            future = batch.add(_functions(chain_manager, [1])[0])
+            raise RuntimeError
+
+    assert future.cancelled()
+    assert batches == []
+    assert provider.single_calls == []
@@ -0,0 +1,31 @@
+import pytest
+
+from vana.cli import COMMANDS, _selected_command, cli
+
+
+@pytest.mark.parametrize("args", [
+    ["--config", "c.yml", "wallet", "balance"],
+    ["--config=c.yml", "wallet", "balance"],
+    ["--no_prompt", "w", "balance"],
+])
+def test_selected_command_skips_top_level_options(args):
+    assert _selected_command(args) == (COMMANDS["wallet"], "balance")
+
+
+def test_selected_command_is_unknown_after_unknown_option():
+    assert _selected_command(["--unknown", "wallet", "balance"]) == (None, None)
+
+
+def test_config_accepts_option_value_before_group(tmp_path):
+    config_file = tmp_path / "c.yml"
+    config_file.write_text("{}\n")
+    config = cli.create_config(["--config", str(config_file), "wallet", "balance", "--wallet.name", "default"])
+    assert (config.command, config.subcommand) == ("wallet", "balance")
+    assert config.wallet.name == "default"
+
+
+def test_parser_is_complete_when_group_is_unknown():
+    args = ["--unknown", "x", "wallet", "balance"]
+    parser = cli.__create_parser__(args)
+    namespace, _ = parser.parse_known_args(["wallet", "balance"])
+    assert namespace.subcommand == "balance"
@@ -0,0 +1,74 @@
+import pytest
+
+import vana
+from vana.client import Client
+
+
+class _FakeChainManager:
+    """Answers Data Registry files reads for IDs up to files_count; IDs in failures fail that many times."""
+
+    def __init__(self, files_count, failures=None):
+        self.files_count = files_count
+        self.failures = dict(failures or {})
+        self.requests = []
+
+    def read_contract_fns(self, file_ids):
+        self.requests.append(list(file_ids))
+        results = []
+        for file_id in file_ids:
+            if self.failures.get(file_id, 0) > 0:
+                self.failures[file_id] -= 1
+                results.append(None)
+            else:
+                results.append((file_id, "0x" + "11" * 20, f"ipfs://{file_id}", 100 + file_id))
+        return results
+
+
+def _client(chain_manager, files_count):
+    client = Client.__new__(Client)
+    client.chain_manager = chain_manager
+    client._file_cache = {}
+    client._disk_cache = None
+    # Reads are stubbed: a files call is just its ID, and filesCount comes from the fake.
+    client._files_fn = lambda file_id: file_id
+    client._read = lambda contract_name, contract, fn_name, *args: files_count
+    client.data_registry_contract = None
+    return client
+
+
+def test_get_files_range_stops_at_files_count():
+    chain_manager = _FakeChainManager(files_count=5)
+    files = _client(chain_manager, 5).get_files_range(3, 10, chunk=2)
+
+    assert [file.id for file in files] == [3, 4, 5]
+    assert chain_manager.requests == [[3, 4], [5]]
+
+
+def test_get_files_range_starts_at_first_file_id():
+    chain_manager = _FakeChainManager(files_count=5)
+    files = _client(chain_manager, 5).get_files_range(0, 3)
+
+    assert [file.id for file in files] == [1, 2]
+
+
+def test_get_files_range_retries_failed_reads_once():
+    chain_manager = _FakeChainManager(files_count=3, failures={2: 1})
+    files = _client(chain_manager, 3).get_files_range(1, 4)
+
+    assert [file.id for file in files] == [1, 2, 3]
+    assert chain_manager.requests == [[1, 2, 3], [2]]
+
+
+def test_get_files_range_raises_when_a_read_keeps_failing():
+    chain_manager = _FakeChainManager(files_count=3, failures={2: 2})
+
+    with pytest.raises(vana.ChainQueryError):
+        _client(chain_manager, 3).get_files_range(1, 4)
+
+
+def test_get_files_range_raises_when_files_count_cannot_be_read():
+    chain_manager = _FakeChainManager(files_count=3)
+
+    with pytest.raises(vana.ChainQueryError):
+        _client(chain_manager, None).get_files_range(1, 4)
+    assert chain_manager.requests == []
@@ -0,0 +1,75 @@
+from types import SimpleNamespace
+
+import pytest
+
+from vana.client import Client
+from vana.utils import disk_cache
+from vana.utils.disk_cache import DiskCache
+
+FILE = [1, "0x" + "11" * 20, "ipfs://file", 100]
+
+
+def test_values_persist_across_instances(tmp_path):
+    path = str(tmp_path / "cache" / "reads.sqlite")
+    DiskCache(path).set("key", {"a": [1, 2]})
+
+    assert DiskCache(path).get("key") == {"a": [1, 2]}
+    assert DiskCache(path).get("other", default="missing") == "missing"
+
+
+def test_clear_removes_values(tmp_path):
+    cache = DiskCache(str(tmp_path / "reads.sqlite"))
+    cache.set("key", 1)
+    cache.clear()
+
+    assert cache.get("key") is None
+
+
+def test_values_expire_after_ttl(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(disk_cache.time, "time", lambda: now[0])
+    cache = DiskCache(str(tmp_path / "reads.sqlite"))
+    cache.set("short", 1, ttl=10)
+    cache.set("forever", 2)
+
+    now[0] += 9
+    assert cache.get("short") == 1
+    now[0] += 1
+    assert cache.get("short") is None
+    assert cache.get("forever") == 2
+
+
+def test_opens_cache_written_without_expiry(tmp_path):
+    import sqlite3
+
+    path = str(tmp_path / "reads.sqlite")
+    with sqlite3.connect(path) as connection:
+        connection.execute("CREATE TABLE cache (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        connection.execute("INSERT INTO cache (key, value) VALUES ('key', '1')")
+    connection.close()
+
+    cache = DiskCache(path)
+    assert cache.get("key") == 1
+    cache.set("key", 2, ttl=60)
+    assert cache.get("key") == 2
+
+
+def _client(cache: DiskCache, network: str, data_registry_address: str) -> Client:
+    client = Client.__new__(Client)
+    client.network = network
+    client.data_registry_contract = SimpleNamespace(address=data_registry_address)
+    client._file_cache = {}
+    client._disk_cache = cache
+    return client
+
+
+@pytest.mark.parametrize("network, address", [
+    ("moksha", "0x" + "bb" * 20),  # Same network, another Data Registry
+    ("satori", "0x" + "aa" * 20),  # Same address, another network
+])
+def test_file_entries_are_isolated_by_network_and_contract(tmp_path, network, address):
+    cache = DiskCache(str(tmp_path / "reads.sqlite"))
+    _client(cache, "moksha", "0x" + "aa" * 20)._store_file(1, FILE)
+
+    assert _client(cache, "moksha", "0x" + "aa" * 20)._cached_file(1) == tuple(FILE)
+    assert _client(cache, network, address)._cached_file(1) is None
@@ -0,0 +1,29 @@
+import pytest
+from web3 import Web3
+
+from vana.utils.wallet_utils import is_address
+
+CHECKSUMMED = "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed"
+
+
+@pytest.mark.parametrize("address", [
+    CHECKSUMMED,
+    CHECKSUMMED.lower(),
+    "0x" + CHECKSUMMED[2:].upper(),
+    CHECKSUMMED[2:],
+    CHECKSUMMED[2:].lower(),
+    "0X" + CHECKSUMMED[2:],
+    "0X" + CHECKSUMMED[2:].lower(),
+    "0X" + CHECKSUMMED[2:].upper(),
+    CHECKSUMMED[:-1] + "D",
+    "0x" + "1" * 40,
+    "0x" + "1" * 39,
+    "0x" + "1" * 41,
+    "0x" + "g" * 40,
+    "",
+    b"\x00" * 20,
+    b"\x00" * 19,
+    None,
+])
+def test_is_address_matches_web3(address):
+    assert is_address(address) == Web3.is_address(address)
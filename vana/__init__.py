@@ -15,17 +15,17 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
-__version__ = "0.41.0"
+__version_info__ = (0, 41, 0)
+__version__ = ".".join(map(str, __version_info__))
 
 import rich
 
 from .config import Config
 
-version_split = __version__.split(".")
 __version_as_int__: int = (
-        (100 * int(version_split[0]))
-        + (10 * int(version_split[1]))
-        + (1 * int(version_split[2]))
+        (100 * __version_info__[0])
+        + (10 * __version_info__[1])
+        + (1 * __version_info__[2])
 )
 
 # Rich console.
@@ -92,22 +92,27 @@ from .keyfile import (
     keyfile,
     Mockkeyfile,
 )
-from .wallet import Wallet
-from .utils import (
-    hash,
-    wallet_utils,
-)
-from .chain_data import (
-    NodeServerInfo
-)
-from .chain_manager import ChainManager
-from .cli import cli as cli, COMMANDS as ALL_COMMANDS
 from .logging import logging
-from .state import State
-from .message import Message, TerminalInfo
-from .node_server import NodeServer
-from .node_client import NodeClient
-from .client import Client
+# `cli`, `keyfile` and `logging` share their names with submodules, so they are imported eagerly:
+# a later `import vana.<submodule>` would otherwise bind the module over the lazily-resolved attribute.
+from .cli import cli as cli, COMMANDS as ALL_COMMANDS
+
+import importlib
+
+# Heavier components (web3, fastapi, aiohttp, pydantic) are imported on first attribute access (PEP 562).
+_LAZY = {
+    "Wallet": ".wallet",
+    "hash": ".utils",
+    "wallet_utils": ".utils",
+    "NodeServerInfo": ".chain_data",
+    "ChainManager": ".chain_manager",
+    "State": ".state",
+    "Message": ".message",
+    "TerminalInfo": ".message",
+    "NodeServer": ".node_server",
+    "NodeClient": ".node_client",
+    "Client": ".client",
+}
 
 
 # Logging helpers.
@@ -143,13 +148,49 @@ block_explorer_tx_templates = {
     "maya": "https://maya.vanascan.io/tx/{}",
 }
 
-configs = [
-    NodeServer.config(),
-    Wallet.config(),
-    ChainManager.config(),
-    logging.get_config(),
-]
-defaults = Config.merge_all(configs)
+_configs_cache = None
+_defaults_cache = None
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        if name in globals():
+            return globals()[name]
+        obj = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = obj
+        return obj
+
+    # `configs` and `defaults` build every component's argparse spec, so they are
+    # only computed the first time they are accessed.
+    global _configs_cache, _defaults_cache
+    if name == "configs":
+        if _configs_cache is None:
+            _configs_cache = [
+                __getattr__("NodeServer").config(),
+                __getattr__("Wallet").config(),
+                __getattr__("ChainManager").config(),
+                logging.get_config(),
+            ]
+        return _configs_cache
+    if name == "defaults":
+        if _defaults_cache is None:
+            _defaults_cache = Config.merge_all(__getattr__("configs"))
+        return _defaults_cache
+
+    # The package's own submodules (utils, chain_data, wallet, ...) are imported on first access too,
+    # so `vana.utils.hash(...)` works without an explicit `import vana.utils`.
+    if not name.startswith("_"):
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | {"configs", "defaults"})
+
 
 banner = r"""_/\\\________/\\\_____/\\\\\\\\\_____/\\\\\_____/\\\_____/\\\\\\\\\\\___
 _\/\\\_______\/\\\___/\\\\\\\\\\\\\__\/\\\\\\___\/\\\___/\\\\\\\\\\\\\__
@@ -166,21 +207,30 @@ import sys
 import os
 
 
-def is_cli_context():
+def _compute_is_cli_context() -> bool:
     """
     Determine if the current context is a CLI invocation by checking how the script is being executed.
     """
-    if sys.argv[0] == '-c':
+    argv = sys.argv
+    if argv and argv[0] == '-c':
         return True
 
     main_module = sys.modules.get('__main__')
     if main_module:
-        module_name = getattr(main_module, '__name__', '')
-        file_name = os.path.basename(getattr(main_module, '__file__', ''))
-        return 'cli' in module_name.lower() or 'cli' in file_name.lower()
+        module_name = (getattr(main_module, '__name__', '') or '').lower()
+        file_name = os.path.basename(getattr(main_module, '__file__', '') or '').lower()
+        return 'cli' in module_name or 'cli' in file_name
 
     return False
 
 
-if not is_cli_context():
-    print(banner)
+# How the process was launched does not change, so this is evaluated once at import.
+_IS_CLI = _compute_is_cli_context()
+
+
+def is_cli_context() -> bool:
+    return _IS_CLI
+
+
+if sys.stdout is not None and sys.stdout.isatty() and not _IS_CLI:
+    sys.stdout.write(banner + "\n")
@@ -16,20 +16,26 @@
 # DEALINGS IN THE SOFTWARE.
 
 import json
-from dataclasses import dataclass, asdict
-from typing import Optional
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
 
 from eth_account.messages import encode_defunct
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from web3 import Web3
 
 import vana
 from vana.utils import networking
 from vana.utils.web3 import as_wad
 
+# ABI types of the fields packed into a proof signature, in signing order.
+_PROOF_TYPES = ('string', 'uint256', 'uint256', 'string', 'string', 'string')
 
-@dataclass
+
+@dataclass(frozen=True)
 class NodeServerInfo:
+    # The field slots plus per-instance caches; the fields are frozen, so cached values never go stale.
+    __slots__ = ("version", "ip", "port", "ip_type", "hotkey", "coldkey", "_ip_str", "_key_cache", "_hash", "_json")
+
     version: int
     ip: str
     port: int
@@ -47,38 +53,67 @@ class NodeServerInfo:
 
     def ip_str(self) -> str:
         """Return the whole IP as string"""
-        return networking.ip__str__(self.ip_type, self.ip, self.port)
+        ip_str = getattr(self, "_ip_str", None)
+        if ip_str is None:
+            ip_str = networking.ip__str__(self.ip_type, self.ip, self.port)
+            object.__setattr__(self, "_ip_str", ip_str)
+        return ip_str
+
+    @property
+    def _key(self) -> tuple:
+        """Identity tuple used for hashing and equality, built once per instance."""
+        key = getattr(self, "_key_cache", None)
+        if key is None:
+            key = (self.version, self.ip, self.port, self.ip_type, self.hotkey, self.coldkey)
+            object.__setattr__(self, "_key_cache", key)
+        return key
 
     def __eq__(self, other: "NodeServerInfo"):
-        if other == None:
+        if other is None:
             return False
-        if (
-                self.version == other.version
-                and self.ip == other.ip
-                and self.port == other.port
-                and self.ip_type == other.ip_type
-                and self.coldkey == other.coldkey
-                and self.hotkey == other.hotkey
-        ):
+        if self is other:
             return True
-        else:
-            return False
+        if not isinstance(other, NodeServerInfo):
+            return NotImplemented
+        return self._key == other._key
 
     def __str__(self):
-        return "NodeServerInfo( {}, {}, {}, {} )".format(
-            str(self.ip_str()), str(self.hotkey), str(self.coldkey), self.version
-        )
+        return f"NodeServerInfo( {self.ip_str()}, {self.hotkey}, {self.coldkey}, {self.version} )"
 
     def __hash__(self):
-        return hash((self.version, self.ip, self.port, self.ip_type, self.hotkey, self.coldkey))
+        h = getattr(self, "_hash", None)
+        if h is None:
+            h = hash(self._key)
+            object.__setattr__(self, "_hash", h)
+        return h
 
     def __repr__(self):
         return self.__str__()
 
+    def __getstate__(self):
+        # Frozen slotted instances need explicit pickle/copy support; caches are rebuilt on demand.
+        return self._key
+
+    def __setstate__(self, state):
+        for name, value in zip(("version", "ip", "port", "ip_type", "hotkey", "coldkey"), state):
+            object.__setattr__(self, name, value)
+
     def to_string(self) -> str:
         """Converts the NodeServerInfo object to a string representation using JSON."""
+        cached = getattr(self, "_json", None)
+        if cached is not None:
+            return cached
         try:
-            return json.dumps(asdict(self))
+            serialized = json.dumps({
+                "version": self.version,
+                "ip": self.ip,
+                "port": self.port,
+                "ip_type": self.ip_type,
+                "hotkey": self.hotkey,
+                "coldkey": self.coldkey,
+            })
+            object.__setattr__(self, "_json", serialized)
+            return serialized
         except (TypeError, ValueError) as e:
             vana.logging.error(f"Error converting NodeServerInfo to string: {e}")
             return NodeServerInfo(0, "", 0, 0, "", "").to_string()
@@ -99,6 +134,8 @@ class NodeServerInfo:
 
 
 class ProofData(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     file_url: str
     score: float
     dlp_id: int
@@ -111,19 +148,36 @@ class Proof(BaseModel):
     signature: Optional[str] = ""
     data: ProofData
 
+    def _packed_fields(self) -> list:
+        """Values of the signed proof fields, in the order of _PROOF_TYPES."""
+        return [
+            self.data.file_url,
+            as_wad(self.data.score),
+            self.data.dlp_id,
+            self.data.metadata,
+            self.data.proof_url,
+            self.data.instruction
+        ]
+
     def sign(self, wallet):
-        packed_data = Web3().solidity_keccak(
-            ['string', 'uint256', 'uint256', 'string', 'string', 'string'],
-            [
-                self.data.file_url,
-                as_wad(self.data.score),
-                self.data.dlp_id,
-                self.data.metadata,
-                self.data.proof_url,
-                self.data.instruction
-            ]
-        )
+        # solidity_keccak is a classmethod, so no Web3 instance is needed.
+        packed_data = Web3.solidity_keccak(_PROOF_TYPES, self._packed_fields())
 
         message = encode_defunct(packed_data)
         self.signature = wallet.hotkey.sign_message(message).signature.hex()
         return self
+
+    @classmethod
+    def sign_batch(cls, proofs: Iterable["Proof"], wallet) -> List["Proof"]:
+        """
+        Sign many proofs with the same wallet, hoisting the per-proof lookups out of the loop.
+        Equivalent to calling `sign` on each proof.
+        """
+        solidity_keccak = Web3.solidity_keccak
+        sign_message = wallet.hotkey.sign_message
+        signed = []
+        for proof in proofs:
+            packed_data = solidity_keccak(_PROOF_TYPES, proof._packed_fields())
+            proof.signature = sign_message(encode_defunct(packed_data)).signature.hex()
+            signed.append(proof)
+        return signed
@@ -16,30 +16,134 @@
 # DEALINGS IN THE SOFTWARE.
 
 import argparse
+import asyncio
 import copy
+import functools
+import json
 import logging as native_logging
 import os
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
 from decimal import Decimal
-from typing import Optional, List, Union
+from typing import Any, Dict, Optional, List, Tuple, Union
 
+import requests
 from eth_account.signers.local import LocalAccount
-from retry import retry
+from requests.adapters import HTTPAdapter
 from rich.prompt import Confirm
-from web3 import Web3
+from web3 import AsyncHTTPProvider, AsyncWeb3, HTTPProvider, Web3
+from web3._utils.abi import get_abi_output_types, map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3._utils.request import make_post_request
 from web3.contract.contract import ContractFunction
 from web3.exceptions import ContractCustomError
-from web3.exceptions import TransactionNotFound
+from web3.exceptions import TimeExhausted, TransactionNotFound
 from web3.middleware import geth_poa_middleware
+from web3.types import HexBytes
+from urllib3.util import Retry
 
 import vana
 from vana.utils.transaction import TransactionManager
+from vana.utils.wallet_utils import is_address
 from vana.utils.web3 import decode_custom_error
 
 logger = native_logging.getLogger("vana")
 
 Balance = Union[int, Decimal]
 
+# Default endpoint for each named network.
+_NETWORK_TO_ENTRYPOINT = {
+    "vana": vana.__vana_entrypoint__,
+    "islander": vana.__islander_entrypoint__,
+    "maya": vana.__maya_entrypoint__,
+    "moksha": vana.__moksha_entrypoint__,
+    "satori": vana.__satori_entrypoint__,
+    "local": vana.__local_entrypoint__,
+    "archive": vana.__archive_entrypoint__,
+}
+
+# (network, default endpoint, endpoint substring) used to recognise a network from an endpoint URL, in match order.
+_ENDPOINT_TO_NETWORK = (
+    ("vana", vana.__vana_entrypoint__, "rpc.vana"),
+    ("islander", vana.__islander_entrypoint__, "rpc.islander.vana"),
+    ("maya", vana.__maya_entrypoint__, "rpc.maya.vana"),
+    ("moksha", vana.__moksha_entrypoint__, "rpc.moksha.vana"),
+    ("satori", vana.__satori_entrypoint__, "rpc.satori.vana"),
+    ("archive", vana.__archive_entrypoint__, "archive.vana"),
+)
+
+# Gas limit for a standard ETH transfer.
+TRANSFER_GAS = 21000
+
+# Seconds to wait for a transfer to be finalized.
+FINALIZATION_TIMEOUT = 300
+
+# Gas price changes at most once per block, so a fetched value is reused for this many seconds.
+GAS_PRICE_TTL = 2.0
+
+# Largest number of calls sent in one JSON-RPC batch; many public RPC providers reject bigger batches.
+BATCH_READ_LIMIT = 20
+
+
+@functools.lru_cache(maxsize=1)
+def _http_session() -> requests.Session:
+    """
+    Returns the process-wide keep-alive session used by RPC providers.
+
+    Every ChainManager (and therefore every Client) shares this one connection pool, so
+    creating another Client does not pay a fresh TCP+TLS handshake on its first call.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=Retry(total=3, backoff_factor=0.3))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _call_with_retry(fn, *args, tries: int = 3, delay: float = 2, backoff: float = 2, max_delay: float = 4, **kwargs):
+    """Calls fn, retrying with exponential backoff on any exception; the last failure is re-raised."""
+    for attempt in range(tries):
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            if attempt == tries - 1:
+                raise
+            logger.warning(f"{e}, retrying in {delay} seconds...")
+            time.sleep(delay)
+            delay = min(delay * backoff, max_delay)
+
+
+def _to_int(value: Union[str, int]) -> int:
+    """Converts a raw JSON-RPC quantity (hex string) to an int."""
+    return int(value, 16) if isinstance(value, str) else int(value)
+
+
+class ReadBatch:
+    """Contract reads queued by ``ChainManager.batch_reads``, read together when the batch is flushed."""
+
+    def __init__(self, chain_manager: "ChainManager", max_batch_size: int = BATCH_READ_LIMIT):
+        self.chain_manager = chain_manager
+        self.max_batch_size = max_batch_size
+        self._queued: List[Tuple[Future, ContractFunction]] = []
+
+    def add(self, function: ContractFunction) -> Future:
+        future = Future()
+        self._queued.append((future, function))
+        return future
+
+    def flush(self):
+        queued, self._queued = self._queued, []
+        results = self.chain_manager.read_contract_fns([function for _, function in queued], self.max_batch_size)
+        for (future, _), result in zip(queued, results):
+            future.set_result(result)
+
+    def cancel(self):
+        queued, self._queued = self._queued, []
+        for future, _ in queued:
+            future.cancel()
+
 
 class ChainManager:
     """
@@ -48,49 +152,22 @@ class ChainManager:
 
     @staticmethod
     def setup_config(network: str, config: vana.Config):
-        chain_endpoint = config.chain.get("chain_endpoint")
-
-        if network is not None:
-            (
-                evaluated_network,
-                evaluated_endpoint,
-            ) = ChainManager.determine_chain_endpoint_and_network(network, chain_endpoint)
-        else:
-            if config.get("__is_set", {}).get("chain.chain_endpoint"):
-                (
-                    evaluated_network,
-                    evaluated_endpoint,
-                ) = ChainManager.determine_chain_endpoint_and_network(
-                    config.chain.chain_endpoint, chain_endpoint
-                )
-            elif config.get("__is_set", {}).get("chain.network"):
-                (
-                    evaluated_network,
-                    evaluated_endpoint,
-                ) = ChainManager.determine_chain_endpoint_and_network(
-                    config.chain.network, chain_endpoint
-                )
-            elif config.chain.get("chain_endpoint"):
-                (
-                    evaluated_network,
-                    evaluated_endpoint,
-                ) = ChainManager.determine_chain_endpoint_and_network(
-                    config.chain.chain_endpoint, chain_endpoint
-                )
-            elif config.chain.get("network"):
-                (
-                    evaluated_network,
-                    evaluated_endpoint,
-                ) = ChainManager.determine_chain_endpoint_and_network(
-                    config.chain.network
-                )
-            else:
-                (
-                    evaluated_network,
-                    evaluated_endpoint,
-                ) = ChainManager.determine_chain_endpoint_and_network(
-                    vana.defaults.chain.network, chain_endpoint
-                )
+        chain = config.chain
+        chain_endpoint = chain.get("chain_endpoint")
+        is_set = config.get("__is_set") or {}
+
+        # First non-empty source wins: explicit argument, then flags set on the command line, then config values.
+        candidates = (
+            network,
+            chain.chain_endpoint if is_set.get("chain.chain_endpoint") else None,
+            chain.network if is_set.get("chain.network") else None,
+            chain_endpoint,
+            chain.get("network"),
+        )
+        chosen = next((candidate for candidate in candidates if candidate), None) or vana.defaults.chain.network
+        evaluated_network, evaluated_endpoint = ChainManager.determine_chain_endpoint_and_network(
+            chosen, chain_endpoint or None
+        )
         return (
             evaluated_endpoint,
             evaluated_network,
@@ -105,24 +182,60 @@ class ChainManager:
         """
         if config is None:
             config = self.config()
-        self.config = copy.deepcopy(config)
+        # Only the chain section is modified below, so copy that instead of deep-copying the whole config.
+        self.config = copy.copy(config)
+        self.config.chain = chain = copy.copy(config.chain)
 
-        self.config.chain.chain_endpoint, self.config.chain.network = ChainManager.setup_config(
-            self.config.chain.network, config)
+        chain.chain_endpoint, chain.network = ChainManager.setup_config(chain.network, config)
 
-        vana.logging.debug(
-            f"Connected to {self.config.chain.network} network and {self.config.chain.chain_endpoint}."
-        )
-        self.web3 = Web3(Web3.HTTPProvider(self.config.chain.chain_endpoint))
+        vana.logging.debug(f"Connected to {chain.network} network and {chain.chain_endpoint}.")
+        self.web3 = Web3(Web3.HTTPProvider(chain.chain_endpoint, session=_http_session()))
         self.web3.middleware_onion.inject(geth_poa_middleware, layer=0)
-        self.wallet = vana.Wallet(config=self.config)
-        self.tx_manager = TransactionManager(self.web3, self.wallet.hotkey)
+        self._chain_id: Optional[int] = None
+        self._tx_template: Optional[Dict[str, int]] = None
+        self._gas_price_cache: Optional[Tuple[int, float]] = None
+        self._nonces: Dict[str, int] = {}
+        self._nonce_lock = threading.Lock()
+        # Built on first use: read-only callers never need to touch the keystore.
+        self._wallet: Optional["vana.Wallet"] = None
+        self._tx_manager: Optional[TransactionManager] = None
+
+    @property
+    def wallet(self) -> "vana.Wallet":
+        if self._wallet is None:
+            self._wallet = vana.Wallet(config=self.config)
+        return self._wallet
+
+    @wallet.setter
+    def wallet(self, wallet: "vana.Wallet"):
+        self._wallet = wallet
+        self._tx_manager = None
+
+    @property
+    def tx_manager(self) -> TransactionManager:
+        if self._tx_manager is None:
+            self._tx_manager = TransactionManager(
+                self.web3, self.wallet.hotkey, chain_id=self.get_chain_id(), batch_request=self.batch_request
+            )
+        return self._tx_manager
+
+    @tx_manager.setter
+    def tx_manager(self, tx_manager: TransactionManager):
+        self._tx_manager = tx_manager
+
+    # Parsed default configs, keyed on the environment variables that feed the argument defaults.
+    _default_configs = {}
 
     @staticmethod
     def config() -> "config":
-        parser = argparse.ArgumentParser()
-        ChainManager.add_args(parser)
-        return vana.Config(parser, args=[])
+        env_key = (os.getenv("CHAIN_NETWORK"), os.getenv("CHAIN_NETWORK_ENDPOINT"))
+        default_config = ChainManager._default_configs.get(env_key)
+        if default_config is None:
+            parser = argparse.ArgumentParser()
+            ChainManager.add_args(parser)
+            default_config = vana.Config(parser, args=[])
+            ChainManager._default_configs[env_key] = default_config
+        return copy.deepcopy(default_config)
 
     @classmethod
     def add_args(cls, parser: argparse.ArgumentParser, prefix: Optional[str] = None):
@@ -217,6 +330,36 @@ class ChainManager:
             base_gas_multiplier=base_gas_multiplier
         )
 
+    def send_transactions(self,
+         functions: List[ContractFunction],
+         account: LocalAccount,
+         value=0,
+         max_retries=3,
+         base_gas_multiplier=1.5,
+         max_workers: int = 8,
+     ) -> List[Any]:
+        """
+        Sends several independent transactions from the same account concurrently. Nonces are still taken
+        and transactions submitted one at a time under the TransactionManager lock; only the waits for
+        their receipts overlap, so N transactions take about as long as the slowest one rather than N times.
+
+        Returns:
+            List[Any]: Per function, in order, the ``(tx_hash, receipt)`` of ``send_transaction`` or the
+            exception it raised.
+        """
+        def send(function: ContractFunction):
+            try:
+                return self.send_transaction(function, account, value, max_retries, base_gas_multiplier)
+            except Exception as e:
+                return e
+
+        if len(functions) < 2:
+            return [send(function) for function in functions]
+        # Create the TransactionManager up front so every worker shares its nonce lock.
+        _ = self.tx_manager
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(functions))) as executor:
+            return list(executor.map(send, functions))
+
     def read_contract_fn(self, function: ContractFunction):
         try:
             return function.call()
@@ -226,6 +369,72 @@ class ChainManager:
         except Exception as e:
             vana.logging.error(f"Failed to read from contract function: {e}")
 
+    def read_contract_fns(
+            self, functions: List[ContractFunction], max_batch_size: int = BATCH_READ_LIMIT
+    ) -> List[Any]:
+        """
+        Reads several contract functions with batched JSON-RPC requests of at most ``max_batch_size`` calls.
+        Each result is what ``read_contract_fn`` returns for that function; if a batch cannot be used (e.g. one
+        of its calls reverts), each of its functions is read on its own so errors are reported per call.
+
+        Args:
+            functions (List[ContractFunction]): Bound contract functions, e.g. ``contract.functions.files(1)``.
+            max_batch_size (int, optional): Most calls sent in one request.
+
+        Returns:
+            List[Any]: The decoded return value of each function, in order, or ``None`` for failed reads.
+        """
+        if len(functions) > max_batch_size:
+            return [
+                result
+                for start in range(0, len(functions), max_batch_size)
+                for result in self.read_contract_fns(functions[start:start + max_batch_size], max_batch_size)
+            ]
+        if len(functions) < 2:
+            return [self.read_contract_fn(function) for function in functions]
+        calls = [
+            ("eth_call", [{"to": function.address, "data": function._encode_transaction_data()}, "latest"])
+            for function in functions
+        ]
+        try:
+            raw_results = self.batch_request(calls)
+        except Exception as e:
+            vana.logging.debug(f"Batched contract read failed, reading functions one by one: {e}")
+            return [self.read_contract_fn(function) for function in functions]
+
+        results = []
+        for function, raw_result in zip(functions, raw_results):
+            try:
+                output_types = get_abi_output_types(function.abi)
+                decoded = map_abi_data(
+                    BASE_RETURN_NORMALIZERS, output_types, self.web3.codec.decode(output_types, HexBytes(raw_result))
+                )
+                results.append(decoded[0] if len(decoded) == 1 else decoded)
+            except Exception:
+                results.append(self.read_contract_fn(function))
+        return results
+
+    @contextmanager
+    def batch_reads(self, max_batch_size: int = BATCH_READ_LIMIT):
+        """
+        Queues contract reads made inside the ``with`` block and sends them together when it exits::
+
+            with chain_manager.batch_reads() as batch:
+                file = batch.add(data_registry.functions.files(1))
+                tee = batch.add(tee_pool.functions.tees(address))
+            file.result(), tee.result()
+
+        Yields:
+            ReadBatch: Its ``add`` returns a Future that resolves to what ``read_contract_fn`` would return.
+        """
+        batch = ReadBatch(self, max_batch_size)
+        try:
+            yield batch
+        except BaseException:
+            batch.cancel()
+            raise
+        batch.flush()
+
     def get_current_block(self) -> int:
         """
         Returns the current block number on the blockchain. This function provides the latest block
@@ -239,6 +448,93 @@ class ChainManager:
         """
         return self.web3.eth.block_number
 
+    def get_chain_id(self) -> int:
+        """
+        Returns the chain id of the connected network. The chain id never changes for an endpoint,
+        so it is fetched once and memoized.
+        """
+        if self._chain_id is None:
+            self._chain_id = self.web3.eth.chain_id
+        return self._chain_id
+
+    def get_gas_price(self) -> int:
+        """
+        Returns the current gas price in wei, reusing the last fetched value for ``GAS_PRICE_TTL`` seconds.
+        """
+        gas_price = self._cached_gas_price()
+        if gas_price is None:
+            gas_price = self._cache_gas_price(self.web3.eth.gas_price)
+        return gas_price
+
+    def _cached_gas_price(self) -> Optional[int]:
+        if self._gas_price_cache is not None:
+            gas_price, fetched_at = self._gas_price_cache
+            if time.monotonic() - fetched_at < GAS_PRICE_TTL:
+                return gas_price
+        return None
+
+    def _cache_gas_price(self, gas_price: int) -> int:
+        self._gas_price_cache = (gas_price, time.monotonic())
+        return gas_price
+
+    def _transfer_transaction(self, dest: str, amount_in_wei: int, gas_price: int, nonce: int) -> Dict:
+        """Fills in a copy of the cached transfer template; only the per-transfer fields change."""
+        if self._tx_template is None:
+            self._tx_template = {'gas': TRANSFER_GAS, 'chainId': self._chain_id}
+        transaction = self._tx_template.copy()
+        transaction['to'] = dest
+        transaction['value'] = amount_in_wei
+        transaction['gasPrice'] = gas_price
+        transaction['nonce'] = nonce
+        return transaction
+
+    def _next_nonce(self, address: str, fetched_nonce: Optional[int] = None) -> int:
+        """
+        Returns the next nonce for address and reserves it: the larger of the locally tracked nonce and the
+        chain's pending transaction count (fetched here unless given as ``fetched_nonce``). Taking the chain
+        into account on every send picks up transactions sent from the same address by other processes or
+        other ChainManagers.
+        """
+        with self._nonce_lock:
+            if fetched_nonce is None:
+                fetched_nonce = self.web3.eth.get_transaction_count(address, "pending")
+            nonce = max(self._nonces.get(address, 0), fetched_nonce)
+            self._nonces[address] = nonce + 1
+            return nonce
+
+    def _reset_nonce(self, address: str):
+        """Drops the locally tracked nonce for address so the next send refetches it from the chain."""
+        with self._nonce_lock:
+            self._nonces.pop(address, None)
+
+    def batch_request(self, calls: List[Tuple[str, list]]) -> List[Any]:
+        """
+        Sends several read-only JSON-RPC calls in a single HTTP round-trip and returns their raw results in
+        call order. Falls back to one request per call when the provider is not HTTP or the batch is rejected.
+
+        Args:
+            calls (List[Tuple[str, list]]): ``(method, params)`` pairs, e.g. ``("eth_getBalance", [address, "latest"])``.
+
+        Returns:
+            List[Any]: The unformatted JSON-RPC result of each call.
+        """
+        provider = self.web3.provider
+        if isinstance(provider, HTTPProvider) and len(calls) > 1:
+            payload = [
+                {"jsonrpc": "2.0", "method": method, "params": params, "id": i}
+                for i, (method, params) in enumerate(calls)
+            ]
+            try:
+                raw_response = make_post_request(
+                    provider.endpoint_uri, json.dumps(payload).encode(), **provider.get_request_kwargs()
+                )
+                responses = sorted(json.loads(raw_response), key=lambda r: r["id"])
+                if len(responses) == len(calls) and all("result" in r for r in responses):
+                    return [r["result"] for r in responses]
+            except Exception as e:
+                vana.logging.debug(f"Batch request failed, falling back to sequential calls: {e}")
+        return [self.web3.manager.request_blocking(method, params) for method, params in calls]
+
     def close(self):
         """
         Cleans up resources for this ChainManager instance like active websocket connection and active extensions
@@ -257,6 +553,7 @@ class ChainManager:
         # return Balance.from_rao(_result.value)
 
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def determine_chain_endpoint_and_network(network: str, chain_endpoint=None):
         """Determines the chain endpoint and network from the passed network or chain_endpoint.
 
@@ -269,62 +566,21 @@ class ChainManager:
         """
         if network is None:
             return None, None
-        if network in vana.__networks__:
-            if network == "vana":
-                return network, chain_endpoint if chain_endpoint is not None else vana.__vana_entrypoint__
-            if network == "islander":
-                return network, chain_endpoint if chain_endpoint is not None else vana.__islander_entrypoint__
-            if network == "maya":
-                return network, chain_endpoint if chain_endpoint is not None else vana.__maya_entrypoint__
-            if network == "moksha":
-                return network, chain_endpoint if chain_endpoint is not None else vana.__moksha_entrypoint__
-            if network == "satori":
-                return network, chain_endpoint if chain_endpoint is not None else vana.__satori_entrypoint__
-            elif network == "local":
-                return network, chain_endpoint if chain_endpoint is not None else vana.__local_entrypoint__
-            elif network == "archive":
-                return network, chain_endpoint if chain_endpoint is not None else vana.__archive_entrypoint__
-        else:
-            if (
-                    network == vana.__vana_entrypoint__
-                    or "rpc.vana" in network
-            ):
-                return "vana", chain_endpoint if chain_endpoint is not None else vana.__vana_entrypoint__
-            elif (
-                    network == vana.__islander_entrypoint__
-                    or "rpc.islander.vana" in network
-            ):
-                return "islander", chain_endpoint if chain_endpoint is not None else vana.__islander_entrypoint__
-            elif (
-                    network == vana.__maya_entrypoint__
-                    or "rpc.maya.vana" in network
-            ):
-                return "maya", chain_endpoint if chain_endpoint is not None else vana.__maya_entrypoint__
-            elif (
-                    network == vana.__moksha_entrypoint__
-                    or "rpc.moksha.vana" in network
-            ):
-                return "moksha", chain_endpoint if chain_endpoint is not None else vana.__moksha_entrypoint__
-            elif (
-                    network == vana.__satori_entrypoint__
-                    or "rpc.satori.vana" in network
-            ):
-                return "satori", chain_endpoint if chain_endpoint is not None else vana.__satori_entrypoint__
-            elif (
-                    network == vana.__archive_entrypoint__
-                    or "archive.vana" in network
-            ):
-                return "archive", chain_endpoint if chain_endpoint is not None else vana.__archive_entrypoint__
-            elif "127.0.0.1" in network or "localhost" in network:
-                return "local", network
-            else:
-                return "unknown", network
+        entrypoint = _NETWORK_TO_ENTRYPOINT.get(network)
+        if entrypoint is not None:
+            return network, chain_endpoint if chain_endpoint is not None else entrypoint
+        for evaluated_network, entrypoint, endpoint_substring in _ENDPOINT_TO_NETWORK:
+            if network == entrypoint or endpoint_substring in network:
+                return evaluated_network, chain_endpoint if chain_endpoint is not None else entrypoint
+        if "127.0.0.1" in network or "localhost" in network:
+            return "local", network
+        return "unknown", network
 
     ################
     #### Legacy ####
     ################
 
-    def get_balance(self, address: str, block: Optional[int] = None) -> Balance:
+    def get_balance(self, address: str, block: Optional[int] = None, raw: bool = False) -> Balance:
         """
         Retrieves the token balance of a specific address within the Vana network. This function queries
         the blockchain to determine the amount of tokens held by a given account.
@@ -332,6 +588,7 @@ class ChainManager:
         Args:
             address (str): The EVM-compatible address.
             block (int, optional): The blockchain block number at which to perform the query.
+            raw (bool, optional): If ``True``, returns the balance in wei as an int instead of in ether.
 
         Returns:
             Balance: The account balance at the specified block, represented as a Balance object.
@@ -341,17 +598,14 @@ class ChainManager:
         """
         vana.logging.info(f"Fetching balance for address {address}")
         try:
-            @retry(delay=2, tries=3, backoff=2, max_delay=4, logger=logger)
-            def make_web3_call_with_retry():
-                vana.logging.info(f"Fetching balance for address {address}")
-                return self.web3.eth.get_balance(address, block_identifier=block)
-
-            result = make_web3_call_with_retry()
+            result = _call_with_retry(self.web3.eth.get_balance, address, block_identifier=block)
         except Exception as e:
             vana.logging.error(f"Error fetching balance for address {address}: {e}")
             return 0
 
         vana.logging.info(f"Balance for address {address}: {result}")
+        if raw:
+            return result
         return Web3.from_wei(result, "ether")
 
     def transfer(
@@ -362,6 +616,9 @@ class ChainManager:
             wait_for_inclusion: bool = True,
             wait_for_finalization: bool = False,
             prompt: bool = False,
+            skip_balance_check: bool = False,
+            gas_price: Optional[int] = None,
+            nonce: Optional[int] = None,
     ) -> bool:
         """
         Executes a transfer of funds from the provided wallet to the specified destination address.
@@ -375,6 +632,10 @@ class ChainManager:
             wait_for_inclusion (bool, optional): Waits for the transaction to be included in a block.
             wait_for_finalization (bool, optional): Waits for the transaction to be finalized on the blockchain.
             prompt (bool, optional): If ``True``, prompts for user confirmation before proceeding.
+            skip_balance_check (bool, optional): If ``True``, skips the balance preflight; an underfunded
+                transfer is then rejected by the node instead.
+            gas_price (int, optional): Gas price in wei to use instead of fetching it.
+            nonce (int, optional): Nonce to use instead of the locally tracked one.
 
         Returns:
             bool: ``True`` if the transfer is successful, False otherwise.
@@ -382,49 +643,76 @@ class ChainManager:
         # TODO: Beware of allowing this to be switched to the hotkey
         signer = wallet.coldkey
 
-        if not Web3.is_address(dest):
+        if not is_address(dest):
             logger.error(f"Invalid destination address: {dest}")
             return False
 
         # Convert amount to Wei.
         amount_in_wei = Web3.to_wei(amount, 'ether') if not isinstance(amount, int) else amount
 
-        # Check balance.
-        logger.info("Checking balance...")
-        account_balance = self.get_balance(signer.address)
-        gas_price = self.web3.eth.gas_price
-        gas_limit = 21000  # Gas limit for a standard ETH transfer
-        fee_in_wei = gas_price * gas_limit
-        fee_in_eth = Web3.from_wei(fee_in_wei, 'ether')
+        # Fetch whatever is not already known (balance, nonce, gas price, chain id) in a single round-trip.
+        if gas_price is None:
+            gas_price = self._cached_gas_price()
+        fetch_nonce = nonce is None
+        calls = []
+        if not skip_balance_check:
+            logger.info("Checking balance...")
+            calls.append(("eth_getBalance", [signer.address, "latest"]))
+        if fetch_nonce:
+            calls.append(("eth_getTransactionCount", [signer.address, "pending"]))
+        fetch_gas_price = gas_price is None
+        if fetch_gas_price:
+            calls.append(("eth_gasPrice", []))
+        if self._chain_id is None:
+            calls.append(("eth_chainId", []))
+        try:
+            results = iter([_to_int(result) for result in self.batch_request(calls)])
+        except Exception as e:
+            logger.error(f"Error preparing transfer from {signer.address}: {e}")
+            return False
+        balance_wei = None if skip_balance_check else next(results)
+        fetched_nonce = next(results) if fetch_nonce else None
+        if fetch_gas_price:
+            gas_price = self._cache_gas_price(next(results))
+        if self._chain_id is None:
+            self._chain_id = next(results)
+        fee_in_wei = gas_price * TRANSFER_GAS
 
         # Check if we have enough balance.
-        if account_balance < (Decimal(amount) + fee_in_eth):
-            logger.error(f"Not enough balance: balance: {account_balance}, amount: {amount}, fee: {fee_in_eth}")
+        if not skip_balance_check and balance_wei < amount_in_wei + fee_in_wei:
+            logger.error(
+                f"Not enough balance: balance: {Web3.from_wei(balance_wei, 'ether')}, amount: {amount}, "
+                f"fee: {Web3.from_wei(fee_in_wei, 'ether')}"
+            )
             return False
 
         # Ask before moving on.
         if prompt:
             if not Confirm.ask(
-                    f"Do you want to transfer: amount: {amount}, from: {signer.address}, to: {dest}, for fee: {fee_in_eth} ETH"):
+                    f"Do you want to transfer: amount: {amount}, from: {signer.address}, to: {dest}, "
+                    f"for fee: {Web3.from_wei(fee_in_wei, 'ether')} ETH"):
                 return False
 
-        # Create and sign the transaction.
-        transaction = {
-            'to': dest,
-            'value': amount_in_wei,
-            'gas': gas_limit,
-            'gasPrice': gas_price,
-            'nonce': self.web3.eth.get_transaction_count(signer.address),
-            'chainId': self.web3.eth.chain_id
-        }
-
-        signed_txn = self.web3.eth.account.sign_transaction(transaction, signer.key)
+        # Create and sign the transaction with the already-parsed key of the signer.
+        transaction = self._transfer_transaction(
+            dest,
+            amount_in_wei,
+            gas_price,
+            nonce if nonce is not None else self._next_nonce(signer.address, fetched_nonce),
+        )
+        signed_txn = signer.sign_transaction(transaction)
 
         # Send the transaction.
         logger.info("Sending transaction...")
-        txn_hash = self.web3.eth.send_raw_transaction(signed_txn.rawTransaction)
+        try:
+            txn_hash = self.web3.eth.send_raw_transaction(signed_txn.rawTransaction)
+        except Exception:
+            # The local nonce may be stale (e.g. "nonce too low"); resync from the chain on the next send.
+            self._reset_nonce(signer.address)
+            raise
 
         # Wait for transaction inclusion.
+        receipt = None
         if wait_for_inclusion:
             try:
                 receipt = self.web3.eth.wait_for_transaction_receipt(txn_hash, timeout=120)
@@ -432,22 +720,142 @@ class ChainManager:
                     logger.info(f"Transaction included in block {receipt.blockNumber}. Hash: {txn_hash.hex()}")
                 else:
                     logger.error("Transaction failed.")
+                    self._reset_nonce(signer.address)
                     return False
-            except TransactionNotFound:
+            except (TimeExhausted, TransactionNotFound):
                 logger.error("Transaction not found within timeout period.")
+                self._reset_nonce(signer.address)
                 return False
 
-        # Wait for transaction finalization.
+        # Wait for transaction finalization, polling with exponential backoff.
         if wait_for_finalization:
-            try:
-                while True:
+            delay = 0.1
+            deadline = time.monotonic() + FINALIZATION_TIMEOUT
+            while receipt is None or receipt.blockNumber is None:
+                try:
                     receipt = self.web3.eth.get_transaction_receipt(txn_hash)
-                    if receipt.blockNumber is not None:
-                        logger.info(f"Transaction finalized in block {receipt.blockNumber}. Hash: {txn_hash.hex()}")
-                        break
-                    time.sleep(2)
-            except TransactionNotFound:
-                logger.error("Transaction not found within timeout period.")
-                return False
+                except TransactionNotFound:
+                    receipt = None
+                if receipt is not None and receipt.blockNumber is not None:
+                    break
+                if time.monotonic() >= deadline:
+                    logger.error("Transaction not found within timeout period.")
+                    self._reset_nonce(signer.address)
+                    return False
+                time.sleep(delay)
+                delay = min(delay * 1.5, 2.0)
+            logger.info(f"Transaction finalized in block {receipt.blockNumber}. Hash: {txn_hash.hex()}")
 
         return True
+
+    @asynccontextmanager
+    async def async_web3(self):
+        """
+        Yields an ``AsyncWeb3`` connected to this ChainManager's endpoint and closes its HTTP session on exit.
+        web3 caches one aiohttp session per thread and endpoint and never closes it; the cache replaces a
+        closed session on its next use.
+
+        Yields:
+            AsyncWeb3: The async connection.
+        """
+        from aiohttp import ClientSession
+
+        provider = AsyncHTTPProvider(self.config.chain.chain_endpoint)
+        own_session = ClientSession(raise_for_status=True)
+        session = await provider.cache_async_session(own_session)
+        if session is not own_session:
+            await own_session.close()
+        try:
+            yield AsyncWeb3(provider)
+        finally:
+            await session.close()
+
+    async def send_transfers(
+            self,
+            wallet: "vana.Wallet",
+            transfers: List[Tuple[str, Union[Balance, float]]],
+            wait_for_inclusion: bool = True,
+    ) -> List[bool]:
+        """
+        Sends several transfers from the same wallet concurrently. Gas price, chain id and the starting nonce
+        are fetched once; nonces are then assigned locally so the transactions can be in flight together.
+
+        Args:
+            wallet (vana.Wallet): The wallet from which funds are being transferred.
+            transfers (List[Tuple[str, Union[Balance, float]]]): ``(dest, amount)`` pairs.
+            wait_for_inclusion (bool, optional): Waits for each transaction to be included in a block.
+
+        Returns:
+            List[bool]: ``True`` for each transfer that succeeded, in the order given.
+        """
+        async with self.async_web3() as web3:
+            return await self._send_transfers(web3, wallet.coldkey, transfers, wait_for_inclusion)
+
+    async def _send_transfers(
+            self,
+            web3: AsyncWeb3,
+            signer: LocalAccount,
+            transfers: List[Tuple[str, Union[Balance, float]]],
+            wait_for_inclusion: bool,
+    ) -> List[bool]:
+        results = [False] * len(transfers)
+        valid = []
+        for i, (dest, amount) in enumerate(transfers):
+            if not is_address(dest):
+                logger.error(f"Invalid destination address: {dest}")
+                continue
+            valid.append((i, dest, Web3.to_wei(amount, 'ether') if not isinstance(amount, int) else amount))
+        if not valid:
+            return results
+
+        try:
+            balance_wei, gas_price, nonce, chain_id = await asyncio.gather(
+                web3.eth.get_balance(signer.address),
+                web3.eth.gas_price,
+                web3.eth.get_transaction_count(signer.address, "pending"),
+                web3.eth.chain_id,
+            )
+        except Exception as e:
+            logger.error(f"Error preparing transfers from {signer.address}: {e}")
+            return results
+        if self._chain_id is None:
+            self._chain_id = chain_id
+
+        total_wei = sum(amount_in_wei for _, _, amount_in_wei in valid) + gas_price * TRANSFER_GAS * len(valid)
+        if balance_wei < total_wei:
+            logger.error(
+                f"Not enough balance: balance: {Web3.from_wei(balance_wei, 'ether')}, "
+                f"required: {Web3.from_wei(total_wei, 'ether')}"
+            )
+            return results
+
+        async def send(nonce: int, dest: str, amount_in_wei: int) -> bool:
+            signed_txn = signer.sign_transaction(self._transfer_transaction(dest, amount_in_wei, gas_price, nonce))
+            try:
+                txn_hash = await web3.eth.send_raw_transaction(signed_txn.rawTransaction)
+                if not wait_for_inclusion:
+                    return True
+                receipt = await web3.eth.wait_for_transaction_receipt(txn_hash, timeout=120)
+            except (TimeExhausted, TransactionNotFound):
+                logger.error(f"Transfer to {dest} not found within timeout period.")
+                self._reset_nonce(signer.address)
+                return False
+            except Exception as e:
+                logger.error(f"Transfer to {dest} failed: {e}")
+                self._reset_nonce(signer.address)
+                return False
+            if receipt.status != 1:
+                logger.error(f"Transfer to {dest} failed.")
+                self._reset_nonce(signer.address)
+                return False
+            logger.info(f"Transaction included in block {receipt.blockNumber}. Hash: {txn_hash.hex()}")
+            return True
+
+        # Reserve nonces up front, in order, sharing the locally tracked sequence used by transfer().
+        nonces = [self._next_nonce(signer.address, nonce) for _ in valid]
+        sent = await asyncio.gather(*(
+            send(nonce, dest, amount_in_wei) for nonce, (_, dest, amount_in_wei) in zip(nonces, valid)
+        ))
+        for (i, _, _), ok in zip(valid, sent):
+            results[i] = ok
+        return results
@@ -18,48 +18,24 @@
 # DEALINGS IN THE SOFTWARE.
 
 import argparse
-import shtab
+import functools
+import importlib
+import json
 import sys
 import os
+import threading
 from pathlib import Path
 import vana
-from importlib.metadata import entry_points
-from typing import List, Optional
-
-from .commands import (
-    GetWalletHistoryCommand,
-    NewColdkeyCommand,
-    NewHotkeyCommand,
-    RegenColdkeyCommand,
-    RegenColdkeypubCommand,
-    RegenHotkeyCommand,
-    TransferCommand,
-    UpdateWalletCommand,
-    WalletBalanceCommand,
-    WalletCreateCommand,
-    ExportPrivateKeyCommand,
-    RegisterCommand
-)
+from importlib.metadata import EntryPoint, entry_points
+from typing import Any, Dict, List, Optional, Tuple
+
+# Shells shtab can generate completion for (shtab.SUPPORTED_SHELLS), listed here so that
+# shtab is only imported when a completion script is actually printed.
+COMPLETION_SHELLS = ("bash", "zsh", "tcsh")
 
 # Create a console instance for CLI display.
 console = vana.__console__
 
-ALIAS_TO_COMMAND = {
-    "root": "root",
-    "wallet": "wallet",
-    "stake": "stake",
-    "satya": "satya",
-    "r": "root",
-    "w": "wallet",
-    "st": "stake",
-    "roots": "root",
-    "wallets": "wallet",
-    "stakes": "stake",
-    "dlp": "dlp",
-    "d": "dlp",
-    "i": "info",
-    "info": "info",
-}
 COMMANDS = {
     "root": {
         "name": "root",
@@ -73,18 +49,19 @@ COMMANDS = {
         "name": "wallet",
         "aliases": ["w", "wallets"],
         "help": "Commands for managing and viewing wallets.",
+        # Built-in commands are given as "module:class" and imported only when their parser is built.
         "commands": {
-            "transfer": TransferCommand,
-            "balance": WalletBalanceCommand,
-            "create": WalletCreateCommand,
-            "new_hotkey": NewHotkeyCommand,
-            "new_coldkey": NewColdkeyCommand,
-            "regen_coldkey": RegenColdkeyCommand,
-            "regen_coldkeypub": RegenColdkeypubCommand,
-            "regen_hotkey": RegenHotkeyCommand,
-            "update": UpdateWalletCommand,
-            "history": GetWalletHistoryCommand,
-            "export_private_key": ExportPrivateKeyCommand,
+            "transfer": "vana.commands.transfer:TransferCommand",
+            "balance": "vana.commands.wallets:WalletBalanceCommand",
+            "create": "vana.commands.wallets:WalletCreateCommand",
+            "new_hotkey": "vana.commands.wallets:NewHotkeyCommand",
+            "new_coldkey": "vana.commands.wallets:NewColdkeyCommand",
+            "regen_coldkey": "vana.commands.wallets:RegenColdkeyCommand",
+            "regen_coldkeypub": "vana.commands.wallets:RegenColdkeypubCommand",
+            "regen_hotkey": "vana.commands.wallets:RegenHotkeyCommand",
+            "update": "vana.commands.wallets:UpdateWalletCommand",
+            "history": "vana.commands.wallets:GetWalletHistoryCommand",
+            "export_private_key": "vana.commands.wallets:ExportPrivateKeyCommand",
         },
     },
     "stake": {
@@ -115,12 +92,82 @@ COMMANDS = {
         "aliases": ["s"],
         "help": "Commands for interacting with the Satya protocol.",
         "commands": {
-            "register": RegisterCommand,
+            "register": "vana.commands.satya:RegisterCommand",
+            "register_batch": "vana.commands.satya:BatchRegisterCommand",
         },
     },
 }
 
 
+# Canonical command name for every command name and alias, resolved once at import.
+ALIAS_TO_COMMAND = {
+    alias: name
+    for name, command in COMMANDS.items()
+    if isinstance(command, dict)
+    for alias in (command["name"], *command["aliases"])
+}
+
+
+def get_command(command: str, subcommand: str) -> Any:
+    """
+    Returns the class of a subcommand, importing it the first time it is needed. Returns ``None`` for
+    an external command whose entry point fails to load; it is then dropped from ``COMMANDS``.
+    """
+    commands = COMMANDS[command]["commands"]
+    command_class = commands[subcommand]
+    if isinstance(command_class, EntryPoint):
+        try:
+            command_class = command_class.load()
+        except Exception as e:
+            _record_failed_entry_point(command_class, e)
+            del commands[subcommand]
+            return None
+    elif isinstance(command_class, str):
+        module_name, _, class_name = command_class.partition(":")
+        command_class = getattr(importlib.import_module(module_name), class_name)
+    commands[subcommand] = command_class
+    return command_class
+
+
+# Top-level options that may come before the command group: those that take a value, and flags.
+_TOP_LEVEL_VALUE_OPTIONS = frozenset({"--config", "--print-completion"})
+_TOP_LEVEL_FLAGS = frozenset({"--strict", "--no_version_checking", "--no_prompt", "--post-install", "-h", "--help"})
+
+
+def _selected_command(args: List[str]) -> Tuple[Optional[Dict], Optional[str]]:
+    """
+    Guesses the command group and subcommand named in ``args`` without parsing them, so that only
+    their parsers need to be built. Either is ``None`` when it cannot be told from ``args``; in
+    particular, an unknown option before the group could take the next argument as its value.
+    """
+    positionals = []
+    skip_value = False
+    for arg in args:
+        if skip_value:
+            skip_value = False
+            continue
+        if not arg.startswith("-"):
+            positionals.append(arg)
+            if len(positionals) == 2:
+                break
+            continue
+        if positionals:
+            # Command groups take no options, so the subcommand is no longer certain.
+            break
+        option = arg.split("=", 1)[0]
+        if option in _TOP_LEVEL_VALUE_OPTIONS:
+            skip_value = "=" not in arg
+        elif option not in _TOP_LEVEL_FLAGS:
+            return None, None
+    if not positionals:
+        return None, None
+    name = ALIAS_TO_COMMAND.get(positionals[0])
+    group = COMMANDS[name] if name is not None else None
+    if group is None or len(positionals) < 2 or positionals[1] not in group["commands"]:
+        return group, None
+    return group, positionals[1]
+
+
 def ensure_local_bin_in_path():
     """Ensures ~/.local/bin is in PATH for the current session"""
     local_bin = str(Path.home() / ".local" / "bin")
@@ -128,6 +175,16 @@ def ensure_local_bin_in_path():
         os.environ["PATH"] = local_bin + os.pathsep + os.environ.get("PATH", "")
 
 
+SHELL_CONFIG_MARKER = "# >>> vanacli PATH >>>"
+SHELL_CONFIG_BLOCK = (
+    f"\n{SHELL_CONFIG_MARKER}\n"
+    'export PATH="$HOME/.local/bin:$PATH"\n'
+    "# <<< vanacli PATH <<<\n"
+)
+# Line written by earlier installers, before the marker block was introduced.
+LEGACY_SHELL_CONFIG_LINE = 'PATH="$HOME/.local/bin:$PATH"'
+
+
 def update_shell_config():
     """Updates shell config to include ~/.local/bin in PATH"""
     local_bin = str(Path.home() / ".local" / "bin")
@@ -145,28 +202,94 @@ def update_shell_config():
     else:  # default to bash
         rc_file = os.path.join(home, ".bashrc")
 
-    if os.path.exists(rc_file):
-        with open(rc_file, 'r') as f:
-            content = f.read()
+    try:
+        with open(rc_file, 'r+') as f:
+            # Scan line by line, stopping at the first vanacli PATH entry.
+            if any(SHELL_CONFIG_MARKER in line or LEGACY_SHELL_CONFIG_LINE in line for line in f):
+                return
+            f.seek(0, os.SEEK_END)
+            f.write(SHELL_CONFIG_BLOCK)
+    except FileNotFoundError:
+        return
+
 
-        if "PATH=\"$HOME/.local/bin:$PATH\"" not in content:
-            with open(rc_file, 'a') as f:
-                f.write('\n# Added by vana installation\nexport PATH="$HOME/.local/bin:$PATH"\n')
+ENTRY_POINT_GROUP = "vanacli.commands"
+# Entry points found on a previous run, valid while no directory on sys.path has changed.
+ENTRY_POINT_CACHE = os.path.join(str(Path.home()), ".cache", "vana", "entrypoints.json")
+
+
+def _sys_path_key() -> List[list]:
+    """Returns the mtime of every sys.path entry; installing or removing a distribution changes it."""
+    key = []
+    for path in sys.path:
+        path = os.path.abspath(path)
+        try:
+            key.append([path, os.stat(path).st_mtime_ns])
+        except OSError:
+            continue
+    return key
+
+
+def _read_entry_point_cache(key: List[list]) -> Dict:
+    """Returns the entry point cache if it was written for the current ``sys.path`` state, else an empty one."""
+    try:
+        with open(ENTRY_POINT_CACHE) as f:
+            cache = json.load(f)
+        if cache["key"] == key:
+            cache.setdefault("groups", {})
+            cache.setdefault("failed", {})
+            return cache
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return {"key": key, "groups": {}, "failed": {}}
+
+
+def _write_entry_point_cache(cache: Dict):
+    try:
+        os.makedirs(os.path.dirname(ENTRY_POINT_CACHE), exist_ok=True)
+        with open(ENTRY_POINT_CACHE, "w") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=None)
+def cached_entry_points(group: str) -> Tuple[EntryPoint, ...]:
+    """
+    Returns the entry points of a group without scanning the metadata of every installed distribution
+    when nothing has been installed or removed since the last run. Entry points that failed to load
+    since then are left out.
+    """
+    cache = _read_entry_point_cache(_sys_path_key())
+    if group not in cache["groups"]:
+        cache["groups"][group] = [[ep.name, ep.value] for ep in entry_points(group=group)]
+        _write_entry_point_cache(cache)
+    failed = set(cache["failed"].get(group, ()))
+    return tuple(EntryPoint(name, value, group) for name, value in cache["groups"][group] if name not in failed)
+
+
+def _record_failed_entry_point(entry_point: EntryPoint, error: Exception):
+    """Reports a plugin that failed to load, once, and skips it until installed packages change."""
+    sys.stderr.write(
+        f"Failed to load vanacli command {entry_point.name!r} from {entry_point.value}: {error}\n"
+        f"It is skipped until installed packages change; delete {ENTRY_POINT_CACHE} to retry sooner.\n"
+    )
+    cache = _read_entry_point_cache(_sys_path_key())
+    failed = cache["failed"].setdefault(entry_point.group, [])
+    if entry_point.name not in failed:
+        failed.append(entry_point.name)
+        _write_entry_point_cache(cache)
 
 
 def load_external_commands():
     """
     Load external commands from entry points.
-    Used to extend CLI functionality
+    Used to extend CLI functionality. The entry points themselves are stored and only loaded by
+    get_command, once their command is selected.
     """
-    eps = entry_points(group='vanacli.commands')
-    COMMANDS["dlp"]["commands"] = {}
-    for entry_point in eps:
-        try:
-            command = entry_point.load()
-            COMMANDS["dlp"]["commands"][entry_point.name] = command
-        except Exception as e:
-            pass
+    COMMANDS["dlp"]["commands"] = {
+        entry_point.name: entry_point for entry_point in cached_entry_points(ENTRY_POINT_GROUP)
+    }
 
 
 class CLIErrorParser(argparse.ArgumentParser):
@@ -210,8 +333,9 @@ class cli:
             config = cli.create_config(args)
 
         self.config = config
-        if self.config.command in ALIAS_TO_COMMAND:
-            self.config.command = ALIAS_TO_COMMAND[self.config.command]
+        command = ALIAS_TO_COMMAND.get(self.config.command)
+        if command is not None:
+            self.config.command = command
         else:
             console.print(
                 f":cross_mark:[red]Unknown command: {self.config.command}[/red]"
@@ -224,24 +348,43 @@ class cli:
         # Ensure ~/.local/bin is in PATH
         ensure_local_bin_in_path()
 
-        # If no_version_checking is not set or set as False in the config, version checking is done.
+        # If no_version_checking is not set or set as False in the config, version checking is done
+        # in the background so the command never waits on the network.
         if not self.config.get("no_version_checking", d=True):
-            try:
-                vana.utils.version_checking()
-            except:
-                # If version checking fails, inform user with an exception.
-                raise RuntimeError(
-                    "To avoid internet-based version checking, pass --no_version_checking while running the CLI."
-                )
+            threading.Thread(target=cli._check_version, daemon=True).start()
+
+    @staticmethod
+    def _check_version():
+        from vana.utils.version import version_checking
+
+        try:
+            version_checking()
+        except Exception as e:
+            vana.logging.debug(
+                f"Version check failed ({e}). "
+                "To avoid internet-based version checking, pass --no_version_checking while running the CLI."
+            )
+
+    # The last parser built and the arguments it was built for, so main() and create_config() share one parser.
+    _parser_cache: Optional[Tuple[Optional[Tuple[str, ...]], argparse.ArgumentParser]] = None
 
     @staticmethod
-    def __create_parser__() -> "argparse.ArgumentParser":
+    def __create_parser__(args: Optional[List[str]] = None) -> "argparse.ArgumentParser":
         """
         Creates the argument parser for the CLI.
 
+        Args:
+            args (List[str], optional): Command line arguments the parser is built for. Only the subcommand
+                they select gets its arguments (or every subcommand of the selected group, if none is
+                given). If ``None``, the parser for every command is built, e.g. for shell completion.
+
         Returns:
             argparse.ArgumentParser: An argument parser object for CLI.
         """
+        key = None if args is None else tuple(args)
+        if cli._parser_cache is not None and cli._parser_cache[0] == key:
+            return cli._parser_cache[1]
+
         # Define the basic argument parser.
         parser = CLIErrorParser(
             description=f"vana cli v{vana.__version__}",
@@ -251,7 +394,7 @@ class cli:
         # Add shtab completion
         parser.add_argument(
             "--print-completion",
-            choices=shtab.SUPPORTED_SHELLS,
+            choices=COMPLETION_SHELLS,
             help="Print shell tab completion script",
         )
         parser.add_argument(
@@ -259,9 +402,11 @@ class cli:
             action="store_true",
             help=argparse.SUPPRESS,  # Hide from help output
         )
+        selected_group, selected_subcommand = _selected_command(args) if args is not None else (None, None)
         # Add arguments for each sub-command.
         cmd_parsers = parser.add_subparsers(dest="command")
-        # Add argument parsers for all available commands.
+        # Every group is listed, but only the selected branch gets its subcommand arguments. When the
+        # group cannot be told from args, every branch gets them.
         for command in COMMANDS.values():
             if isinstance(command, dict):
                 subcmd_parser = cmd_parsers.add_parser(
@@ -272,12 +417,17 @@ class cli:
                 subparser = subcmd_parser.add_subparsers(
                     help=command["help"], dest="subcommand", required=True
                 )
-
-                for subcommand in command["commands"].values():
-                    subcommand.add_args(subparser)
+                if selected_group is not None and command is not selected_group:
+                    continue
+                for name in list(command["commands"]):
+                    if selected_subcommand is None or name == selected_subcommand:
+                        command_class = get_command(command["name"], name)
+                        if command_class is not None:
+                            command_class.add_args(subparser)
             else:
                 command.add_args(cmd_parsers)
 
+        cli._parser_cache = (key, parser)
         return parser
 
     @staticmethod
@@ -291,7 +441,7 @@ class cli:
         Returns:
             config: The configuration object for Vana CLI.
         """
-        parser = cli.__create_parser__()
+        parser = cli.__create_parser__(args)
 
         # If no arguments are passed, print help text and exit the program.
         if len(args) == 0:
@@ -310,13 +460,12 @@ class cli:
         """
         # Check if command exists, if so, run the corresponding check_config.
         # If command doesn't exist, inform user and exit the program.
-        if config.command in COMMANDS:
-            command = config.command
-            command_data = COMMANDS[command]
-
+        command = config.command
+        command_data = COMMANDS.get(command)
+        if command_data is not None:
             if isinstance(command_data, dict):
                 if config["subcommand"] != None:
-                    command_data["commands"][config["subcommand"]].check_config(config)
+                    get_command(command, config["subcommand"]).check_config(config)
                 else:
                     console.print(
                         f":cross_mark:[red]Missing subcommand for: {config.command}[/red]"
@@ -334,6 +483,8 @@ class cli:
         """
         # Check for print-completion argument
         if self.config.print_completion:
+            import shtab
+
             parser = cli.__create_parser__()
             shell = self.config.print_completion
             print(shtab.complete(parser, shell))
@@ -342,11 +493,10 @@ class cli:
         # Check if command exists, if so, run the corresponding method.
         # If command doesn't exist, inform user and exit the program.
         command = self.config.command
-        if command in COMMANDS:
-            command_data = COMMANDS[command]
-
+        command_data = COMMANDS.get(command)
+        if command_data is not None:
             if isinstance(command_data, dict):
-                command_data["commands"][self.config["subcommand"]].run(self)
+                get_command(command, self.config["subcommand"]).run(self)
             else:
                 command_data.run(self)
         else:
@@ -357,10 +507,15 @@ class cli:
 
 
 def main():
+    # Top-level help lists command groups only, so it needs neither plugins nor any subcommand parser.
+    if sys.argv[1:] in ([], ["-h"], ["--help"]):
+        cli.__create_parser__([]).print_help()
+        return
+
     load_external_commands()
 
     # Create the parser with shtab support
-    parser = cli.__create_parser__()
+    parser = cli.__create_parser__(sys.argv[1:])
     args, unknown = parser.parse_known_args()
 
     # Handle post-install PATH setup
@@ -370,7 +525,9 @@ def main():
         return
 
     if args.print_completion:  # Check for print-completion argument
-        print(shtab.complete(parser, args.print_completion))
+        import shtab
+
+        print(shtab.complete(cli.__create_parser__(), args.print_completion))
         return
 
     try:
@@ -1,98 +1,363 @@
 import argparse
 import copy
+import functools
 import json
 import os
+import time
 import vana
-from typing import Optional
-from vana.chain_data import Proof, ProofData
-from vana.contracts import contracts
-from vana.utils.web3 import as_wad
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Tuple
+
+if TYPE_CHECKING:
+    from vana.chain_data import ProofData
+
+
+class File(NamedTuple):
+    """A file registered in the Data Registry contract."""
+    id: int
+    owner_address: str
+    url: str
+    added_at_block: int
+
+
+class Tee(NamedTuple):
+    """A TEE registered in the TEE Pool contract."""
+    tee_address: str
+    url: str
+    status: int
+    amount: int
+    withdrawn_amount: int
+    jobs_count: int
+    public_key: str
+
+
+_ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+# Bounds and per-outcome factors of the gas multiplier each contract function starts its sends with.
+# maxFeePerGas is only a ceiling, so the multiplier never drops below the default: a lower one would
+# leave no headroom for a rising base fee without lowering what is actually paid.
+_DEFAULT_GAS_MULTIPLIER = 1.5
+_MIN_GAS_MULTIPLIER = _DEFAULT_GAS_MULTIPLIER
+_MAX_GAS_MULTIPLIER = 4.0
+_GAS_MULTIPLIER_ON_FAILURE = 1.5
+_GAS_MULTIPLIER_ON_SUCCESS = 1.1
+_MAX_RETRY_DELAY = 64
+
+# Errors raised by TransactionManager for transactions that would revert; retrying them cannot help.
+_NON_RETRYABLE_ERRORS = ("Transaction would revert", "Contract custom error")
+
+_CONTRACTS_DIR = os.path.join(os.path.dirname(__file__), "contracts")
+
+
+@functools.lru_cache(maxsize=None)
+def _load_abi(contract_name: str) -> list:
+    """Reads and parses a contract ABI shipped in vana/contracts, once per process."""
+    with open(os.path.join(_CONTRACTS_DIR, f"{contract_name}.json")) as f:
+        return json.load(f)
+
+
+@functools.lru_cache(maxsize=None)
+def _read_signature(contract_name: str, fn_name: str) -> Tuple[bytes, List[str], List[str]]:
+    """Returns the 4-byte selector and the ABI input and output types of a contract view function."""
+    from eth_utils import function_abi_to_4byte_selector
+    from web3._utils.abi import get_abi_input_types, get_abi_output_types
+
+    fn_abi = next(
+        abi for abi in _load_abi(contract_name) if abi.get("type") == "function" and abi["name"] == fn_name
+    )
+    return function_abi_to_4byte_selector(fn_abi), get_abi_input_types(fn_abi), get_abi_output_types(fn_abi)
 
 
 class Client:
+    # Parsed default configs, keyed on the environment variables that feed the argument defaults.
+    _default_configs = {}
+
     @staticmethod
     def config() -> "config":
-        parser = argparse.ArgumentParser()
-        vana.Client.add_args(parser)
-        return vana.Config(parser, args=[])
+        env_key = (
+            os.getenv("TEE_POOL_CONTRACT_ADDRESS"),
+            os.getenv("DATA_REGISTRY_CONTRACT_ADDRESS"),
+            os.getenv("DLP_ROOT_CONTRACT_ADDRESS"),
+        )
+        default_config = Client._default_configs.get(env_key)
+        if default_config is None:
+            parser = argparse.ArgumentParser()
+            vana.Client.add_args(parser)
+            default_config = vana.Config(parser, args=[])
+            Client._default_configs[env_key] = default_config
+        return copy.deepcopy(default_config)
 
     @classmethod
     def add_args(cls, parser: argparse.ArgumentParser, prefix: Optional[str] = None):
         prefix_str = "" if prefix is None else f"{prefix}."
-        try:
-            parser.add_argument(
-                "--" + prefix_str + "client.tee_pool_contract_address",
-                default=os.getenv("TEE_POOL_CONTRACT_ADDRESS") or None,
-                type=str,
-                help="""The address for the TEE Pool Contract.""")
-            parser.add_argument(
-                "--" + prefix_str + "client.data_registry_contract_address",
-                default=os.getenv("DATA_REGISTRY_CONTRACT_ADDRESS") or None,
-                type=str,
-                help="""The address for the Data Registry Contract.""")
-            parser.add_argument(
-                "--" + prefix_str + "client.dlp_root_contract_address",
-                default=os.getenv("DLP_ROOT_CONTRACT_ADDRESS") or None,
-                type=str,
-                help="""The address for the DLP Root Contract.""")
-        except argparse.ArgumentError:
-            # re-parsing arguments.
-            pass
-
-    def __init__(self, config: vana.Config):
+        # Re-parsing adds the same arguments again; skip them up front rather than catching ArgumentError.
+        if prefix_str + "client.tee_pool_contract_address" in {action.dest for action in parser._actions}:
+            return
+        parser.add_argument(
+            "--" + prefix_str + "client.tee_pool_contract_address",
+            default=os.getenv("TEE_POOL_CONTRACT_ADDRESS") or None,
+            type=str,
+            help="""The address for the TEE Pool Contract.""")
+        parser.add_argument(
+            "--" + prefix_str + "client.data_registry_contract_address",
+            default=os.getenv("DATA_REGISTRY_CONTRACT_ADDRESS") or None,
+            type=str,
+            help="""The address for the Data Registry Contract.""")
+        parser.add_argument(
+            "--" + prefix_str + "client.dlp_root_contract_address",
+            default=os.getenv("DLP_ROOT_CONTRACT_ADDRESS") or None,
+            type=str,
+            help="""The address for the DLP Root Contract.""")
+
+    def __init__(
+            self,
+            config: vana.Config,
+            cache_dir: Optional[str] = None,
+            chain_manager: Optional["vana.ChainManager"] = None,
+    ):
+        """
+        :param config: Client, chain and wallet configuration
+        :param cache_dir: Directory in which immutable contract reads (registered files) are kept across
+            restarts. Defaults to the VANA_RPC_CACHE_DIR environment variable; if neither is set, those reads
+            are only cached in memory.
+        :param chain_manager: ChainManager to use instead of creating one from config. Many Clients can share
+            one, and with it its HTTP connection pool and cached chain id, gas price and nonces. The Client then
+            uses the manager's network, whatever config.chain.network says.
+        """
         if config is None:
             config = self.config()
-        self.config = copy.deepcopy(config)
+        # Client never mutates its config in place, and Wallet and ChainManager copy what they change,
+        # so a shallow copy is enough to keep the caller's config isolated.
+        self.config = copy.copy(config)
 
-        self.wallet = vana.Wallet(config=self.config)
-        self.chain_manager = vana.ChainManager(config=self.config)
         self.network = self.config.chain.network
+        if chain_manager is not None:
+            self.chain_manager = chain_manager
+            # Contract addresses and cache keys must follow the network the manager is connected to.
+            self.network = chain_manager.config.chain.network
+        # Registered files never change, so they are only read from the chain once.
+        self._file_cache: Dict[int, File] = {}
+        # Gas multiplier to start the next send of each contract function with, adjusted by its outcomes.
+        self._gas_multipliers: Dict[str, float] = {}
+        # Last jobs count read and when (time.monotonic()), so progress polling can reuse a recent value.
+        self._jobs_count_cache: Optional[Tuple[int, float]] = None
+        cache_dir = cache_dir or os.getenv("VANA_RPC_CACHE_DIR")
+        if cache_dir:
+            from vana.utils.disk_cache import DiskCache
 
-        # Load contracts
-        data_registry_contract_path = os.path.join(
-            os.path.dirname(__file__),
-            "contracts/DataRegistry.json"
-        )
-        with open(data_registry_contract_path) as f:
-            data_registry_address = contracts[self.network]["DataRegistry"]
-            if hasattr(self.config, 'client') and self.config.client is not None:
-                data_registry_address = self.config.client.data_registry_contract_address or data_registry_address
-
-            self.data_registry_contract = self.chain_manager.web3.eth.contract(
-                address=data_registry_address,
-                abi=json.load(f)
-            )
+            self._disk_cache = DiskCache(os.path.join(os.path.expanduser(cache_dir), "reads.sqlite"))
+        else:
+            self._disk_cache = None
 
-        tee_pool_contract_path = os.path.join(
-            os.path.dirname(__file__),
-            "contracts/TeePool.json"
-        )
-        with open(tee_pool_contract_path) as f:
-            tee_pool_address = contracts[self.network]["TeePool"]
-            if hasattr(self.config, 'client') and self.config.client is not None:
-                tee_pool_address = self.config.client.tee_pool_contract_address or tee_pool_address
-
-            self.tee_pool_contract = self.chain_manager.web3.eth.contract(
-                address=tee_pool_address,
-                abi=json.load(f)
-            )
+    # The wallet and chain connection are also created on first use: read-only callers never open the
+    # keystore, and the first transaction-sending call pays for loading the hotkey.
+
+    @functools.cached_property
+    def wallet(self) -> "vana.Wallet":
+        return vana.Wallet(config=self.config)
+
+    @functools.cached_property
+    def chain_manager(self) -> "vana.ChainManager":
+        return vana.ChainManager(config=self.config)
+
+    # Contracts are created on first use, so callers that only touch one never read the other's ABI.
+
+    def _contract_address(self, contract_name: str, address_option: str) -> str:
+        """
+        Returns the address given by the ``client.<address_option>`` config value, falling back to the
+        address deployed on this network.
+        """
+        from vana.contracts import contracts
+
+        address = contracts[self.network][contract_name]
+        client_config = self.config.get("client")
+        if client_config is not None:
+            address = client_config.get(address_option) or address
+        return address
+
+    def _contract(self, contract_name: str, address_option: str):
+        address = self._contract_address(contract_name, address_option)
+        return self.chain_manager.web3.eth.contract(address=address, abi=_load_abi(contract_name))
+
+    @functools.cached_property
+    def data_registry_contract(self):
+        return self._contract("DataRegistry", "data_registry_contract_address")
+
+    @functools.cached_property
+    def tee_pool_contract(self):
+        return self._contract("TeePool", "tee_pool_contract_address")
+
+    # Unbound functions for the batched reads and the per-proof write, looked up once; calling one only binds
+    # and encodes the arguments.
+
+    @functools.cached_property
+    def _files_fn(self):
+        return self.data_registry_contract.functions.files
+
+    @functools.cached_property
+    def _tees_fn(self):
+        return self.tee_pool_contract.functions.tees
+
+    @functools.cached_property
+    def _file_permissions_fn(self):
+        return self.data_registry_contract.functions.filePermissions
+
+    @functools.cached_property
+    def _data_registry_add_proof_fn(self):
+        return self.data_registry_contract.functions.addProof
+
+    @functools.cached_property
+    def _tee_pool_add_proof_fn(self):
+        return self.tee_pool_contract.functions.addProof
+
+    def _read(self, contract_name: str, contract, fn_name: str, *args):
+        """
+        Reads a view function with calldata built from its precomputed selector and decodes the result
+        directly, skipping web3's per-call ABI lookup and selector hashing. A read that fails is repeated
+        through ChainManager.read_contract_fn, which decodes and logs the error and returns None.
+        """
+        from web3._utils.abi import map_abi_data
+        from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+
+        selector, input_types, output_types = _read_signature(contract_name, fn_name)
+        web3 = self.chain_manager.web3
+        try:
+            data = selector + web3.codec.encode(input_types, args)
+            raw_result = web3.eth.call({"to": contract.address, "data": "0x" + data.hex()})
+            decoded = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, web3.codec.decode(output_types, raw_result))
+        except Exception:
+            return self.chain_manager.read_contract_fn(getattr(contract.functions, fn_name)(*args))
+        return decoded[0] if len(decoded) == 1 else decoded
 
     # Data Registry
 
-    def get_file(self, file_id: int):
+    def _file_cache_key(self, file_id: int) -> str:
+        return f"{self.network}:{self.data_registry_contract.address}:files:{file_id}"
+
+    def _cached_file(self, file_id: int) -> Optional[File]:
+        file = self._file_cache.get(file_id)
+        if file is None and self._disk_cache is not None:
+            cached = self._disk_cache.get(self._file_cache_key(file_id))
+            if cached is not None:
+                file = self._file_cache[file_id] = File._make(cached)
+        return file
+
+    def _store_file(self, file_id: int, file) -> File:
+        self._file_cache[file_id] = File._make(file)
+        if self._disk_cache is not None:
+            self._disk_cache.set(self._file_cache_key(file_id), list(file))
+        return self._file_cache[file_id]
+
+    def get_file(self, file_id: int, refresh: bool = False):
         """
         Retrieve a file from the Data Registry contract
         :param file_id:
-        :return: File<id, ownerAddress, url, addedAtBlock>
+        :param refresh: Read the file from the chain even if it was already fetched. If that read fails, None is
+            returned rather than the copy fetched before
+        :return: File<id, owner_address, url, added_at_block>, or None if the file is not registered or could not
+            be read
         """
-        get_file_fn = self.data_registry_contract.functions.files(file_id)
-        file = self.chain_manager.read_contract_fn(get_file_fn)
+        if not refresh:
+            file = self._cached_file(file_id)
+            if file is not None:
+                return file
+        file = self._read("DataRegistry", self.data_registry_contract, "files", file_id)
         if file is None:
             return None
-        (id, ownerAddress, url, addedAtBlock) = file
-        if ownerAddress == "0x0000000000000000000000000000000000000000":
+        if file[1] == _ZERO_ADDRESS:  # ownerAddress of an unregistered file
             return None
-        return file
+        return self._store_file(file_id, file)
+
+    def get_files(self, file_ids: List[int], refresh: bool = False) -> List:
+        """
+        Retrieve several files from the Data Registry contract in one batched request
+        :param file_ids: IDs of the files to look up
+        :param refresh: Read the files from the chain even if they were already fetched. As with get_file, a file
+            that fails to read is then None, not the copy fetched before
+        :return: A File<id, owner_address, url, added_at_block> (or None, as for get_file) per ID, in order
+        """
+        found = {}
+        missing = []
+        for file_id in file_ids:
+            file = None if refresh else self._cached_file(file_id)
+            if file is None:
+                missing.append(file_id)
+            else:
+                found[file_id] = file
+        files = self.chain_manager.read_contract_fns(
+            [self._files_fn(file_id) for file_id in missing]
+        )
+        for file_id, file in zip(missing, files):
+            if file is not None and file[1] != _ZERO_ADDRESS:
+                found[file_id] = self._store_file(file_id, file)
+        return [found.get(file_id) for file_id in file_ids]
+
+    async def get_files_async(self, file_ids: List[int], concurrency: int = 100) -> List:
+        """
+        Retrieve several files from the Data Registry contract with concurrent requests, at most
+        ``concurrency`` of them in flight at once
+        :param file_ids: IDs of the files to look up
+        :param concurrency: Most reads sent to the RPC node at the same time
+        :return: A File<id, owner_address, url, added_at_block> (or None, as for get_file) per ID, in order
+        """
+        import asyncio
+
+        semaphore = asyncio.Semaphore(concurrency)
+        address = self._contract_address("DataRegistry", "data_registry_contract_address")
+
+        async def read(files_fn, file_id: int):
+            async with semaphore:
+                try:
+                    file = await files_fn(file_id).call()
+                except Exception as e:
+                    vana.logging.error(f"Failed to read from contract function: {e}")
+                    return
+            if file[1] != _ZERO_ADDRESS:
+                self._store_file(file_id, file)
+
+        missing = [file_id for file_id in file_ids if self._cached_file(file_id) is None]
+        if missing:
+            # The connection is closed once the reads are done, so no HTTP session outlives this call.
+            async with self.chain_manager.async_web3() as web3:
+                files_fn = web3.eth.contract(address=address, abi=_load_abi("DataRegistry")).functions.files
+                await asyncio.gather(*(read(files_fn, file_id) for file_id in missing))
+        return [self._file_cache.get(file_id) for file_id in file_ids]
+
+    def get_files_range(self, start: int, end: int, chunk: int = 200) -> List[File]:
+        """
+        Scan the Data Registry for the files with IDs in [start, end), one batched request per chunk of IDs.
+        File IDs are assigned sequentially from 1, so the scan stops after the last registered file (filesCount).
+        :param start: First file ID to look up
+        :param end: File ID to stop before
+        :param chunk: Number of files fetched per request
+        :return: The registered files in the range, in ID order
+        :raises vana.ChainQueryError: If the file count or a file in the range could not be read
+        """
+        files_count = self._read("DataRegistry", self.data_registry_contract, "filesCount")
+        if files_count is None:
+            raise vana.ChainQueryError("Failed to read the number of files in the Data Registry")
+        start, end = max(start, 1), min(end, files_count + 1)
+
+        found = []
+        for base in range(start, end, chunk):
+            file_ids = list(range(base, min(base + chunk, end)))
+            files = self.get_files(file_ids)
+            # Every ID up to filesCount is registered, so a missing file is a failed read: try those once more.
+            failed = [file_id for file_id, file in zip(file_ids, files) if file is None]
+            if failed:
+                self.get_files(failed)
+                files = [self._file_cache.get(file_id) for file_id in file_ids]
+                failed = [file_id for file_id, file in zip(file_ids, files) if file is None]
+                if failed:
+                    raise vana.ChainQueryError(f"Failed to read files {failed} from the Data Registry")
+            found.extend(files)
+        return found
+
+    def clear_caches(self):
+        """Forget files read from the chain, in memory and on disk, so they are fetched again on next use."""
+        self._file_cache.clear()
+        if self._disk_cache is not None:
+            self._disk_cache.clear()
 
     def get_file_permissions(self, file_id: int, account: str) -> str:
         """
@@ -102,19 +367,38 @@ class Client:
         :param account: Address of the account to check permissions for
         :return: The encryption key for the account, or an empty string if no permissions
         """
-        get_permissions_fn = self.data_registry_contract.functions.filePermissions(file_id, account)
-        permissions = self.chain_manager.read_contract_fn(get_permissions_fn)
-        return permissions
+        return self._read("DataRegistry", self.data_registry_contract, "filePermissions", file_id, account)
+
+    def get_file_permissions_bulk(self, pairs: List[Tuple[int, str]]) -> List[str]:
+        """
+        Get the permissions of several (file, account) pairs in one batched request.
 
-    def add_file(self, url: str, integrity_hash: Optional[str] = None):
+        :param pairs: (file_id, account) pairs, as for get_file_permissions
+        :return: Per pair, in order, the encryption key for the account, an empty string if no permissions,
+            or None if the read failed
+        """
+        return self.chain_manager.read_contract_fns(
+            [self._file_permissions_fn(file_id, account) for file_id, account in pairs]
+        )
+
+    def add_file(self, url: str):
         """
         Add a file to the Data Registry contract.
         :param url: URL where encrypted file is uploaded
-        :param integrity_hash: Optional ETAG, last-modified, or other hash to verify file integrity
         :return: Transaction hex, Transaction receipt
         """
         add_file_fn = self.data_registry_contract.functions.addFile(url)
-        return self.chain_manager.send_transaction(add_file_fn, self.wallet.hotkey)
+        return self._send_with_adaptive_retry(add_file_fn)
+
+    def batch_reads(self):
+        """
+        Queue contract reads and send them together; see ChainManager.batch_reads::
+
+            with client.batch_reads() as batch:
+                file = batch.add(client.data_registry_contract.functions.files(1))
+                jobs_count = batch.add(client.tee_pool_contract.functions.jobsCount())
+        """
+        return self.chain_manager.batch_reads()
 
     # TEE Pool Contract
 
@@ -124,14 +408,23 @@ class Client:
         :param address: Address (hotkey) of TEE
         :return: Transaction hex, Transaction receipt
         """
-        get_tee_fn = self.tee_pool_contract.functions.tees(address)
-        tee = self.chain_manager.read_contract_fn(get_tee_fn)
+        tee = self._read("TeePool", self.tee_pool_contract, "tees", address)
         if tee is None:
             return None
-        (teeAddress, url, status, amount, withdrawnAmount, jobsCount, publicKey) = tee
-        if url == "":
+        if tee[1] == "":  # url of an unregistered TEE
             return None
-        return tee
+        return Tee._make(tee)
+
+    def get_tees(self, addresses: List[str]) -> List:
+        """
+        Get the TEE information for several registered TEEs in one batched request
+        :param addresses: Addresses (hotkeys) of the TEEs
+        :return: The TEE information (or None, as for get_tee) per address, in order
+        """
+        tees = self.chain_manager.read_contract_fns(
+            [self._tees_fn(address) for address in addresses]
+        )
+        return [None if tee is None or tee[1] == "" else Tee._make(tee) for tee in tees]
 
     def register_tee(self, url: str, public_key: str, tee_address: str):
         """
@@ -142,9 +435,21 @@ class Client:
         @return: Transaction hex, Transaction receipt
         """
         register_fn = self.tee_pool_contract.functions.addTee(tee_address, url, public_key)
-        return self.chain_manager.send_transaction(register_fn, self.wallet.hotkey)
+        return self._send_with_adaptive_retry(register_fn)
+
+    def register_tees(self, tees: List[Tuple[str, str, str]]) -> List:
+        """
+        Register several TEE compute nodes concurrently, overlapping the waits for their receipts; see
+        register_tee.
+        @param tees: (url, public_key, tee_address) triples
+        @return: Per TEE, in order, (Transaction hex, Transaction receipt) or the exception raised sending it
+        """
+        add_tee_fn = self.tee_pool_contract.functions.addTee
+        return self._send_all_with_adaptive_retry(
+            [add_tee_fn(tee_address, url, public_key) for url, public_key, tee_address in tees]
+        )
 
-    def add_proof(self, proof_data: ProofData, file_id: int | None = None, job_id: int | None = None):
+    def add_proof(self, proof_data: "ProofData", file_id: int | None = None, job_id: int | None = None):
         """
         Add a proof for a job to the Data Registry contract.
 
@@ -153,10 +458,37 @@ class Client:
         :param proof_data: A dictionary containing the proof data
         :return: Transaction hex, Transaction receipt
         """
+        from vana.chain_data import Proof
+
         if (job_id is None) == (file_id is None):
             raise ValueError("One of job_id or file_id must be provided, but not both")
 
         signed_proof = Proof(data=proof_data).sign(self.wallet)
+        return self._send_with_adaptive_retry(self._add_proof_fn(signed_proof, file_id, job_id))
+
+    def add_proofs(self, proofs: List[Tuple["ProofData", Optional[int], Optional[int]]]) -> List:
+        """
+        Add several independent proofs concurrently; see add_proof.
+
+        :param proofs: (proof_data, file_id, job_id) triples, each with exactly one of file_id or job_id set
+        :return: Per proof, in order, (Transaction hex, Transaction receipt) or the exception raised sending it
+        """
+        from vana.chain_data import Proof
+
+        if any((job_id is None) == (file_id is None) for _, file_id, job_id in proofs):
+            raise ValueError("One of job_id or file_id must be provided, but not both")
+
+        signed_proofs = Proof.sign_batch([Proof(data=proof_data) for proof_data, _, _ in proofs], self.wallet)
+        return self._send_all_with_adaptive_retry(
+            [
+                self._add_proof_fn(signed_proof, file_id, job_id)
+                for signed_proof, (_, file_id, job_id) in zip(signed_proofs, proofs)
+            ]
+        )
+
+    def _add_proof_fn(self, signed_proof, file_id: Optional[int], job_id: Optional[int]):
+        from vana.utils.web3 import as_wad
+
         proof_tuple = (
             signed_proof.signature,
             (
@@ -167,18 +499,58 @@ class Client:
                 signed_proof.data.instruction,
             )
         )
-
         if file_id is not None:
-            add_proof_fn = self.data_registry_contract.functions.addProof(file_id, proof_tuple)
-        else:
-            add_proof_fn = self.tee_pool_contract.functions.addProof(job_id, proof_tuple)
-        return self.chain_manager.send_transaction(
-            function=add_proof_fn,
-            account=self.wallet.hotkey,
-            value=0,
-            max_retries=3,
-            base_gas_multiplier=1.5
-        )
+            return self._data_registry_add_proof_fn(file_id, proof_tuple)
+        return self._tee_pool_add_proof_fn(job_id, proof_tuple)
+
+    def _send_with_adaptive_retry(self, function, max_retries: int = 3):
+        """
+        Send a transaction from the hotkey, retrying failed attempts with exponential backoff. The gas
+        multiplier is remembered per contract function: each failed attempt raises it by
+        _GAS_MULTIPLIER_ON_FAILURE, up to _MAX_GAS_MULTIPLIER, and each success lowers it by
+        _GAS_MULTIPLIER_ON_SUCCESS, back down to the default. Under contention sends start with enough gas
+        instead of climbing up from the default every time, and once it eases they relax back to it.
+        :param function: Contract function to send
+        :param max_retries: Maximum number of attempts
+        :return: Transaction hex, Transaction receipt
+        """
+        name = function.fn_name
+        for attempt in range(max_retries):
+            multiplier = self._gas_multipliers.get(name, _DEFAULT_GAS_MULTIPLIER)
+            try:
+                result = self.chain_manager.send_transaction(
+                    function, self.wallet.hotkey, max_retries=1, base_gas_multiplier=multiplier
+                )
+            except Exception as e:
+                if str(e).startswith(_NON_RETRYABLE_ERRORS) or attempt == max_retries - 1:
+                    raise
+                self._gas_multipliers[name] = min(multiplier * _GAS_MULTIPLIER_ON_FAILURE, _MAX_GAS_MULTIPLIER)
+                time.sleep(min(2 ** attempt, _MAX_RETRY_DELAY))
+                continue
+            self._gas_multipliers[name] = max(multiplier / _GAS_MULTIPLIER_ON_SUCCESS, _MIN_GAS_MULTIPLIER)
+            return result
+
+    def _send_all_with_adaptive_retry(self, functions: List, max_workers: int = 8) -> List:
+        """
+        Send several independent transactions from the hotkey concurrently, each through
+        _send_with_adaptive_retry. Nonces are still taken one at a time under the TransactionManager lock;
+        only the waits for receipts overlap.
+        :param functions: Contract functions to send
+        :param max_workers: Most transactions in flight at once
+        :return: Per function, in order, (Transaction hex, Transaction receipt) or the exception raised sending it
+        """
+        def send(function):
+            try:
+                return self._send_with_adaptive_retry(function)
+            except Exception as e:
+                return e
+
+        if len(functions) < 2:
+            return [send(function) for function in functions]
+        # Create the wallet and TransactionManager up front so every worker shares them (and the nonce lock).
+        _ = self.wallet, self.chain_manager.tx_manager
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(functions))) as executor:
+            return list(executor.map(send, functions))
 
     def claim(self):
         """
@@ -188,19 +560,28 @@ class Client:
         claim_fn = self.tee_pool_contract.functions.claim()
         return self.chain_manager.send_transaction(claim_fn, self.wallet.hotkey)
 
-    def get_jobs_count(self) -> int:
+    def get_jobs_count(self, max_age_ms: int = 500) -> int:
         """
         Get the total number of jobs from the TEE Pool contract
 
+        Args:
+            max_age_ms: Reuse the count read within this many milliseconds instead of reading it again, so
+                polling for progress does not cost a request per poll. Pass 0 to always read the latest count.
+
         Returns:
             int: Total number of jobs in the queue
         """
-        try:
-            # Call the TEE Pool contract's jobCount method
-            job_count_fn = self.tee_pool_contract.functions.jobsCount()
-            job_count = self.chain_manager.read_contract_fn(job_count_fn)
-            return job_count
-        except Exception as e:
-            vana.logging.error(f"Error getting job count: {str(e)}")
-            # Return 0 if unable to get count to avoid breaking progress calculation
+        if self._jobs_count_cache is not None:
+            job_count, read_at = self._jobs_count_cache
+            if (time.monotonic() - read_at) * 1000 < max_age_ms:
+                return job_count
+
+        # Call the TEE Pool contract's jobCount method
+        job_count = self._read("TeePool", self.tee_pool_contract, "jobsCount")
+        if job_count is None:
+            # ChainManager.read_contract_fn has logged why the read failed. Return 0 to avoid breaking
+            # progress calculation
+            vana.logging.error("Error getting job count, returning 0")
             return 0
+        self._jobs_count_cache = (job_count, time.monotonic())
+        return job_count
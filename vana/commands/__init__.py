@@ -15,6 +15,8 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import importlib
+
 from munch import Munch, munchify
 
 defaults: Munch = munchify(
@@ -35,17 +37,31 @@ defaults: Munch = munchify(
     }
 )
 
-from .wallets import (
-    NewColdkeyCommand,
-    NewHotkeyCommand,
-    RegenColdkeyCommand,
-    RegenColdkeypubCommand,
-    RegenHotkeyCommand,
-    UpdateWalletCommand,
-    WalletCreateCommand,
-    WalletBalanceCommand,
-    GetWalletHistoryCommand,
-    ExportPrivateKeyCommand,
-)
-from .transfer import TransferCommand
-from .satya import RegisterCommand
+# Command classes are imported on first access, so loading one command module does not load the others.
+_LAZY = {
+    "NewColdkeyCommand": ".wallets",
+    "NewHotkeyCommand": ".wallets",
+    "RegenColdkeyCommand": ".wallets",
+    "RegenColdkeypubCommand": ".wallets",
+    "RegenHotkeyCommand": ".wallets",
+    "UpdateWalletCommand": ".wallets",
+    "WalletCreateCommand": ".wallets",
+    "WalletBalanceCommand": ".wallets",
+    "GetWalletHistoryCommand": ".wallets",
+    "ExportPrivateKeyCommand": ".wallets",
+    "TransferCommand": ".transfer",
+    "RegisterCommand": ".satya",
+    "BatchRegisterCommand": ".satya",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        obj = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = obj
+        return obj
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
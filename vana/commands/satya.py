@@ -16,13 +16,39 @@
 # DEALINGS IN THE SOFTWARE.
 
 import argparse
+import csv
+import sys
 import traceback
+from typing import Dict, Tuple
 
 from rich.prompt import Prompt
 
 import vana
 from vana.commands.base_command import BaseCommand
 
+# ChainManagers shared by the runs in this process, keyed on the chain and wallet settings they were built from.
+_chain_managers: Dict[Tuple, "vana.ChainManager"] = {}
+
+
+def _get_chain_manager(config: "vana.Config") -> "vana.ChainManager":
+    """
+    Returns the ChainManager for config's chain and wallet, creating it on first use. Scripts that register
+    many nodes from one process reuse its RPC connection, chain id and locally tracked nonces.
+    """
+    chain = config.get("chain") or {}
+    wallet = config.get("wallet") or {}
+    key = (
+        chain.get("network"),
+        chain.get("chain_endpoint"),
+        wallet.get("name"),
+        wallet.get("hotkey"),
+        wallet.get("path"),
+    )
+    chain_manager = _chain_managers.get(key)
+    if chain_manager is None:
+        chain_manager = _chain_managers[key] = vana.ChainManager(config=config)
+    return chain_manager
+
 
 class RegisterCommand(BaseCommand):
     """
@@ -49,11 +75,12 @@ class RegisterCommand(BaseCommand):
         url = cli.config.url
         vana.__console__.print(f"Registering URL with Satya: [bold]{url}[/bold]")
         try:
-            vana_client = vana.Client(config=cli.config)
+            vana_client = vana.Client(config=cli.config, chain_manager=_get_chain_manager(cli.config))
             wallet = vana.Wallet(config=cli.config if cli.config.wallet else None)
 
-            tee_address = cli.config.get('tee_address', wallet.hotkey.address)
-            public_key = cli.config.get('public_key', wallet.get_hotkey_public_key())
+            # Only derive the hotkey's address and public key when they were not given.
+            tee_address = cli.config.get('tee_address') or wallet.hotkey.address
+            public_key = cli.config.get('public_key') or wallet.get_hotkey_public_key()
 
             tx_hash, tx_receipt = vana_client.register_tee(
                 url=cli.config.url,
@@ -97,3 +124,100 @@ class RegisterCommand(BaseCommand):
         if not config.get("url") and not config.no_prompt:
             url = Prompt.ask("Enter the URL to register")
             config.url = url
+
+
+class BatchRegisterCommand(BaseCommand):
+    """
+    Executes the `register_batch` command to register several validator nodes at once using the TEE Pool Contract.
+
+    The nodes are read from a CSV file with one ``tee_address,url[,public_key]`` row per node; a row without a
+    public key uses the wallet's hotkey public key, as `register` does. The registrations are sent concurrently,
+    so the batch takes about as long as a single registration.
+
+    Args:
+        input (str): Path of the CSV file listing the nodes to register
+        wallet (str): The name of the wallet to use for registration, should have neccessary permissions
+
+    Example usage:
+        vanacli satya register_batch --input=tees.csv --wallet.name=dlp-owner --chain.network=moksha
+    """
+
+    @staticmethod
+    def run(cli: "vana.cli"):
+        """Register the URLs listed in a CSV file with the Satya protocol."""
+        from vana.utils.wallet_utils import is_address
+
+        try:
+            # Parse and validate every row before anything is sent, so a bad line cannot abort a half-sent batch.
+            rows, errors = [], []
+            with open(cli.config.input, newline="") as f:
+                reader = csv.reader(f)
+                for row in reader:
+                    line_number = reader.line_num
+                    if not row or not "".join(row).strip() or row[0].startswith("#"):
+                        continue
+                    row = [column.strip() for column in row]
+                    if len(row) < 2 or len(row) > 3 or not row[0] or not row[1]:
+                        errors.append(f"line {line_number}: expected tee_address,url[,public_key]")
+                    elif not is_address(row[0]):
+                        errors.append(f"line {line_number}: invalid TEE address '{row[0]}'")
+                    else:
+                        rows.append(row)
+            if errors:
+                vana.__console__.print(
+                    f"[bold red]Invalid rows in {cli.config.input}; nothing was registered:[/bold red]")
+                for error in errors:
+                    vana.__console__.print(f"- {error}")
+                return
+
+            vana_client = vana.Client(config=cli.config, chain_manager=_get_chain_manager(cli.config))
+            default_public_key = None
+            tees = []
+            for row in rows:
+                tee_address, url = row[0], row[1]
+                public_key = row[2] if len(row) > 2 else ""
+                if not public_key:
+                    if default_public_key is None:
+                        default_public_key = vana_client.wallet.get_hotkey_public_key()
+                    public_key = default_public_key
+                tees.append((url, public_key, tee_address))
+
+            vana.__console__.print(f"Registering {len(tees)} URLs with Satya")
+            results = vana_client.register_tees(tees)
+
+            for (url, _, tee_address), result in zip(tees, results):
+                if isinstance(result, Exception):
+                    vana.__console__.print(f"[bold red]Failed to register '{url}' ({tee_address}):[/bold red] {result}")
+                elif result[1]['status'] == 1:
+                    vana.__console__.print(
+                        f"[bold green]Registered '{url}' ({tee_address}).[/bold green] "
+                        f"Transaction hash: {result[0].hex()}"
+                    )
+                else:
+                    vana.__console__.print(
+                        f"[bold red]Transaction registering '{url}' ({tee_address}) failed.[/bold red]")
+
+        except Exception as e:
+            vana.__console__.print(f"[bold red]Error:[/bold red] {str(e)}")
+            traceback.print_exc()
+
+    @staticmethod
+    def add_args(parser: argparse.ArgumentParser):
+        satya_parser = parser.add_parser(
+            "register_batch", help="Register the URLs listed in a CSV file with the Satya protocol."
+        )
+        satya_parser.add_argument("--input", type=str, required=False,
+                                  help="CSV file with one tee_address,url[,public_key] row per node to register.")
+        satya_parser.add_argument("--wallet.name", type=str, required=False,
+                                  help="The name of the wallet to use for registration.")
+        satya_parser.add_argument("--chain.network", type=str, required=False,
+                                  help="The network to use for registration.")
+
+    @staticmethod
+    def check_config(config: "vana.Config"):
+        if not config.get("input"):
+            if config.no_prompt:
+                vana.__console__.print(
+                    "[bold red]--input is required: the CSV file listing the nodes to register.[/bold red]")
+                sys.exit(1)
+            config.input = Prompt.ask("Enter the path of the CSV file to register")
@@ -17,6 +17,7 @@
 
 import argparse
 import sys
+from typing import Optional
 import vana
 from rich.prompt import Prompt
 from vana.commands.base_command import BaseCommand
@@ -53,13 +54,12 @@ class TransferCommand(BaseCommand):
     @staticmethod
     def run(cli: "vana.cli"):
         r"""Transfer token of amount to destination."""
+        chain_manager: Optional["vana.ChainManager"] = None
         try:
-            chain_manager: "vana.ChainManager" = vana.ChainManager(
-                config=cli.config
-            )
+            chain_manager = vana.ChainManager(config=cli.config)
             TransferCommand._run(cli, chain_manager)
         finally:
-            if "chain_manager" in locals():
+            if chain_manager is not None:
                 chain_manager.close()
                 vana.logging.debug("closing chain_manager connection")
 
@@ -77,6 +77,9 @@ class TransferCommand(BaseCommand):
 
     @staticmethod
     def check_config(config: "vana.Config"):
+        # Imported here: the validator pulls in web3, which building the parser does not need.
+        from vana.utils.wallet_utils import is_valid_vana_address_or_public_key
+
         if not config.is_set("wallet.name") and not config.no_prompt:
             wallet_name = Prompt.ask("Enter wallet name", default=defaults.wallet.name)
             config.wallet.name = str(wallet_name)
@@ -84,7 +87,7 @@ class TransferCommand(BaseCommand):
         # Get destination.
         if not config.dest and not config.no_prompt:
             dest = Prompt.ask("Enter destination public key: (h160 or secp256k1)")
-            if not vana.utils.is_valid_vana_address_or_public_key(dest):
+            if not is_valid_vana_address_or_public_key(dest):
                 sys.exit()
             else:
                 config.dest = str(dest)
@@ -18,7 +18,6 @@
 import argparse
 from getpass import getpass
 import os
-import requests
 import sys
 import vana
 from rich.panel import Panel
@@ -29,6 +28,7 @@ from vana.commands.base_command import BaseCommand
 
 from . import defaults
 from ..wallet import display_private_key_msg
+from ..utils.wallet_utils import is_valid_vana_address_or_public_key
 
 
 class RegenColdkeyCommand(BaseCommand):
@@ -200,7 +200,7 @@ class RegenColdkeypubCommand(BaseCommand):
                 config.public_key_hex = prompt_answer
             else:
                 config.h160_address = prompt_answer
-        if not vana.utils.is_valid_vana_address_or_public_key(
+        if not is_valid_vana_address_or_public_key(
                 address=(
                         config.h160_address if config.h160_address else config.public_key_hex
                 )
@@ -761,11 +761,12 @@ class WalletBalanceCommand(BaseCommand):
     @staticmethod
     def run(cli: "vana.cli"):
         """Check the balance of the wallet."""
+        subtensor: Optional["vana.ChainManager"] = None
         try:
-            subtensor: "vana.ChainManager" = vana.ChainManager(config=cli.config)
+            subtensor = vana.ChainManager(config=cli.config)
             WalletBalanceCommand._run(cli, subtensor)
         finally:
-            if "subtensor" in locals():
+            if subtensor is not None:
                 subtensor.close()
                 vana.logging.debug("closing subtensor connection")
 
@@ -1013,6 +1014,8 @@ class GetWalletHistoryCommand(BaseCommand):
 
 def get_wallet_transfers(wallet_address) -> List[dict]:
     """Get all transfers associated with the provided wallet address."""
+    # Imported here: every wallet command loads this module, and only `history` talks to the indexer.
+    import requests
 
     variables = {
         "first": MAX_TXN,
@@ -14,48 +14,61 @@
 # THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
-
 import logging
 
+# Live references, bound once to avoid repeated attribute lookups.
+_LOGGER_DICT = logging.root.manager.loggerDict
+_Logger = logging.Logger
+_PlaceHolder = logging.PlaceHolder
 
-def all_loggers():
+
+def _iter_loggers():
     """
-    Generator that yields all logger instances in the application.
+    Generator that yields ``(name, logger)`` pairs for every real logger in the application.
     """
-    for logger in logging.root.manager.loggerDict.values():
-        if isinstance(logger, logging.PlaceHolder):
+    for name, logger in _LOGGER_DICT.items():
+        if isinstance(logger, _PlaceHolder):
             continue
         # In some versions of Python, the values in loggerDict might be
         # LoggerAdapter instances instead of Logger instances.
         # We check for Logger instances specifically.
-        if isinstance(logger, logging.Logger):
-            yield logger
-        else:
-            # If it's not a Logger instance, it could be a LoggerAdapter or
-            # another form that doesn't directly offer logging methods.
-            # This branch can be extended to handle such cases as needed.
-            pass
+        if isinstance(logger, _Logger):
+            yield name, logger
+
+
+def all_loggers():
+    """
+    Generator that yields all logger instances in the application.
+    """
+    for _, logger in _iter_loggers():
+        yield logger
 
 
 def all_logger_names():
-    for name, logger in logging.root.manager.loggerDict.items():
-        if isinstance(logger, logging.PlaceHolder):
-            continue
-        # In some versions of Python, the values in loggerDict might be
-        # LoggerAdapter instances instead of Logger instances.
-        # We check for Logger instances specifically.
-        if isinstance(logger, logging.Logger):
-            yield name
-        else:
-            # If it's not a Logger instance, it could be a LoggerAdapter or
-            # another form that doesn't directly offer logging methods.
-            # This branch can be extended to handle such cases as needed.
-            pass
+    for name, _ in _iter_loggers():
+        yield name
+
+
+# Longest logger name, and the size of the logger registry it was computed for.
+_MAX_NAME_CACHE = {"size": -1, "value": 0}
 
 
 def get_max_logger_name_length():
-    max_length = 0
-    for name in all_logger_names():
-        if len(name) > max_length:
-            max_length = len(name)
-    return max_length
+    """
+    Returns the length of the longest logger name. The result is cached and only
+    recomputed when the number of registered loggers changes.
+    """
+    size = len(_LOGGER_DICT)
+    if _MAX_NAME_CACHE["size"] != size:
+        _MAX_NAME_CACHE["value"] = max((len(name) for name in all_logger_names()), default=0)
+        _MAX_NAME_CACHE["size"] = size
+    return _MAX_NAME_CACHE["value"]
+
+
+def configure_fast_logging():
+    """
+    Opt-in: stop the logging module from walking the call stack to find the caller's
+    file, function and line number for every record. Records will no longer carry
+    accurate ``pathname``/``funcName``/``lineno`` values.
+    """
+    logging._srcfile = None
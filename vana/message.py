@@ -24,6 +24,7 @@ from typing import Optional, List, Any, Dict
 import pydantic
 
 import vana
+import vana.utils
 
 
 def get_size(obj, seen=None) -> int:
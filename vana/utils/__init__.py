@@ -17,6 +17,7 @@
 
 import hashlib
 from .wallet_utils import *  # noqa F401
+from .version import version_checking  # noqa F401
 
 def hash(content, encoding="utf-8"):
     sha3 = hashlib.sha3_256()
@@ -1,5 +1,5 @@
 from threading import Lock
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, Callable, List
 from web3 import Web3
 from web3.exceptions import ContractLogicError, ContractCustomError
 from web3.types import TxReceipt, HexBytes, Nonce
@@ -10,11 +10,27 @@ from vana.utils.web3 import decode_custom_error
 
 
 class TransactionManager:
-    def __init__(self, web3: Web3, account: LocalAccount):
+    def __init__(
+            self,
+            web3: Web3,
+            account: LocalAccount,
+            chain_id: Optional[int] = None,
+            batch_request: Optional[Callable[[List[Tuple[str, list]]], List[Any]]] = None,
+    ):
+        """
+        Args:
+            web3: Connection to send transactions through
+            account: Account whose pending transactions are cleared
+            chain_id: Chain id of the connection, if already known; otherwise it is fetched
+            batch_request: Sends ``(method, params)`` JSON-RPC calls in one round-trip and returns their raw
+                results, e.g. ChainManager.batch_request. Used to fetch each attempt's nonce, gas estimate and
+                fees together.
+        """
         self.web3 = web3
         self.account = account
         self._nonce_lock = Lock()
-        self.chain_id = self.web3.eth.chain_id
+        self.chain_id = chain_id if chain_id is not None else self.web3.eth.chain_id
+        self._batch_request = batch_request
 
     def _clear_pending_transactions(self, max_wait_time: int = 180):
         """
@@ -87,6 +103,46 @@ class TransactionManager:
         except Exception as e:
             vana.logging.error(f"Error clearing pending transactions: {str(e)}")
 
+    def _preflight(self, function: Any, account: LocalAccount, value: int) -> Tuple[int, int, int, int]:
+        """
+        Fetches the pending nonce, gas estimate, latest base fee and max priority fee for a transaction, in
+        one batched request when possible. If the batch cannot be used (e.g. the transaction would revert),
+        they are fetched one by one so errors are raised as usual.
+        """
+        if self._batch_request is not None:
+            try:
+                results = self._batch_request([
+                    ("eth_getTransactionCount", [account.address, "pending"]),
+                    ("eth_estimateGas", [{
+                        "from": account.address,
+                        "to": function.address,
+                        "data": function._encode_transaction_data(),
+                        "value": hex(value),
+                    }]),
+                    ("eth_getBlockByNumber", ["latest", False]),
+                    ("eth_maxPriorityFeePerGas", []),
+                ])
+                nonce, gas_estimate, block, priority_fee = results
+                return (
+                    int(nonce, 16),
+                    int(gas_estimate, 16),
+                    int(block["baseFeePerGas"], 16),
+                    int(priority_fee, 16),
+                )
+            except Exception as e:
+                vana.logging.debug(f"Batched transaction preflight failed, fetching values one by one: {e}")
+
+        nonce = self.web3.eth.get_transaction_count(account.address, 'pending')
+        gas_estimate = function.estimate_gas({
+            'from': account.address,
+            'value': value,
+            'chainId': self.chain_id,
+            'nonce': nonce
+        })
+        base_fee = self.web3.eth.get_block('latest')['baseFeePerGas']
+        priority_fee = self.web3.eth.max_priority_fee
+        return nonce, gas_estimate, base_fee, priority_fee
+
     def send_transaction(
             self,
             function: Any,
@@ -132,22 +188,14 @@ class TransactionManager:
         while retry_count < max_retries:
             try:
                 with self._nonce_lock:
-                    # Get nonce directly from chain within lock
-                    nonce = self.web3.eth.get_transaction_count(self.account.address, 'pending')
+                    # Get nonce directly from chain within lock, along with the gas estimate and fees
+                    nonce, gas_estimate, base_fee, priority_fee = self._preflight(function, account, value)
 
                     # Estimate gas with conservative buffer
-                    gas_estimate = function.estimate_gas({
-                        'from': account.address,
-                        'value': value,
-                        'chainId': self.chain_id,
-                        'nonce': nonce
-                    })
                     gas_limit = int(gas_estimate * 2)
 
                     # Calculate gas prices for EIP-1559
-                    base_fee = self.web3.eth.get_block('latest')['baseFeePerGas']
                     gas_multiplier = base_gas_multiplier * (1.5 ** retry_count)
-                    priority_fee = self.web3.eth.max_priority_fee
                     max_fee_per_gas = int(base_fee * gas_multiplier) + priority_fee
                     max_priority_fee_per_gas = priority_fee
 
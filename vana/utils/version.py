@@ -0,0 +1,56 @@
+# The MIT License (MIT)
+# Copyright © 2024 Corsali, Inc. dba Vana
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+import os
+import time
+from pathlib import Path
+
+import vana
+
+# When the latest release on PyPI was last looked up; the lookup is repeated at most once per interval.
+VERSION_CHECK_FILE = os.path.join(str(Path.home()), ".cache", "vana", "version_check")
+VERSION_CHECK_INTERVAL = 24 * 60 * 60
+
+
+def _version_tuple(version: str):
+    return tuple(int(part) for part in version.split(".") if part.isdigit())
+
+
+def version_checking(timeout: int = 15):
+    """
+    Warns if a newer vana release is on PyPI. The lookup is skipped if one was done within the last
+    ``VERSION_CHECK_INTERVAL`` seconds.
+    """
+    try:
+        if time.time() - os.path.getmtime(VERSION_CHECK_FILE) < VERSION_CHECK_INTERVAL:
+            return
+    except OSError:
+        pass
+
+    import requests
+
+    response = requests.get("https://pypi.org/pypi/vana/json", timeout=timeout)
+    response.raise_for_status()
+    latest_version = response.json()["info"]["version"]
+
+    os.makedirs(os.path.dirname(VERSION_CHECK_FILE), exist_ok=True)
+    Path(VERSION_CHECK_FILE).touch()
+
+    if _version_tuple(latest_version) > vana.__version_info__:
+        vana.logging.warning(
+            f"A newer version of vana ({latest_version}) is available; you are using {vana.__version__}. "
+            "Upgrade with: pip install --upgrade vana"
+        )
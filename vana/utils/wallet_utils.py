@@ -15,6 +15,7 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import re
 from typing import Union, Optional
 
 from eth_keys import keys
@@ -22,6 +23,33 @@ from eth_utils import decode_hex
 from web3 import Web3
 
 
+_HEX_ADDRESS_RE = re.compile(r"(0x)?[0-9a-f]{40}", re.IGNORECASE | re.ASCII)
+# eth-utils before 5.0 rejects a mixed-case address whose checksum is wrong; later versions accept any hex address.
+_CHECKS_CHECKSUM = not Web3.is_address("0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAeD")
+
+
+def is_address(address: Union[str, bytes]) -> bool:
+    """
+    Checks if the given value is a valid Ethereum address. Equivalent to ``Web3.is_address``, but only
+    computes the keccak-based checksum for mixed-case addresses.
+
+    Args:
+        address (Union[str, bytes]): The address to check.
+
+    Returns:
+        bool: True if the address is valid, False otherwise.
+    """
+    if not isinstance(address, str):
+        return Web3.is_address(address)
+    if _HEX_ADDRESS_RE.fullmatch(address) is None:
+        return False
+    hex_digits = address[-40:]
+    if not _CHECKS_CHECKSUM or hex_digits.islower() or hex_digits.isupper() or hex_digits.isnumeric():
+        return True
+    # Mixed case is a checksum, and a checksummed address is always written with a lowercase 0x prefix.
+    return address.startswith("0x") and Web3.is_checksum_address(address)
+
+
 def is_valid_secp256k1_pubkey(public_key: Union[str, bytes]) -> bool:
     """
     Checks if the given public_key is a valid Ethereum secp256k1 key.
@@ -65,7 +93,7 @@ def is_valid_vana_address_or_public_key(address: Union[str, bytes]) -> bool:
         bool: True if the address is a valid Ethereum address or public key, False otherwise.
     """
     if isinstance(address, str):
-        return Web3.is_address(address) or is_valid_secp256k1_pubkey(address)
+        return is_address(address) or is_valid_secp256k1_pubkey(address)
     elif isinstance(address, bytes):
         return is_valid_secp256k1_pubkey(address)
     return False
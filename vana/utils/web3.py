@@ -15,13 +15,36 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
-from typing import Union
+from typing import Dict, Tuple, Union
 
 from eth_abi import decode
 from web3 import Web3
 from web3.types import ABI
 
 
+# Selector -> error ABI entry, per contract ABI. Keyed by id(); the ABI itself is kept to detect id reuse.
+_ERROR_SELECTOR_CACHE: Dict[int, Tuple[ABI, Dict[bytes, dict]]] = {}
+
+
+def _error_selectors(contract_abi: ABI) -> Dict[bytes, dict]:
+    """
+    Returns the 4-byte selector -> error ABI mapping for a contract ABI, built once per ABI.
+    """
+    cached = _ERROR_SELECTOR_CACHE.get(id(contract_abi))
+    if cached is not None and cached[0] is contract_abi:
+        return cached[1]
+
+    selectors = {}
+    for item in contract_abi:
+        if item['type'] == 'error':
+            # Construct the full error signature from the ABI definition
+            inputs = ','.join(input['type'] for input in item['inputs'])
+            full_signature = f"{item['name']}({inputs})"
+            selectors.setdefault(bytes(Web3.keccak(text=full_signature)[:4]), item)
+    _ERROR_SELECTOR_CACHE[id(contract_abi)] = (contract_abi, selectors)
+    return selectors
+
+
 def decode_custom_error(contract_abi: ABI, error_data: Union[str, bytes]) -> str:
     """
     Decodes a custom contract error using the contract ABI.
@@ -36,23 +59,13 @@ def decode_custom_error(contract_abi: ABI, error_data: Union[str, bytes]) -> str
     if isinstance(error_data, str):
         error_data = Web3.to_bytes(hexstr=error_data)
 
-    # Extract the error signature (first 4 bytes of the error data)
-    error_sig = error_data[:4].hex()
-
-    for item in contract_abi:
-        if item['type'] == 'error':
-            # Construct the full error signature from the ABI definition
-            inputs = ','.join(input['type'] for input in item['inputs'])
-            full_signature = f"{item['name']}({inputs})"
-            calculated_sig = Web3.keccak(text=full_signature)[:4].hex()
-
-            # Compare and match the calculated signature with the error signature from the data
-            if calculated_sig[2:] == error_sig:
-                error_abi = item
-                error_args = error_data[4:]
-                error_decoded = decode([input['type'] for input in error_abi['inputs']], error_args)
-                error_message = f"{error_abi['name']}({', '.join(map(str, error_decoded))})"
-                return error_message
+    # Match the error signature (first 4 bytes of the error data) against the ABI's error selectors
+    error_abi = _error_selectors(contract_abi).get(bytes(error_data[:4]))
+    if error_abi is not None:
+        error_args = error_data[4:]
+        error_decoded = decode([input['type'] for input in error_abi['inputs']], error_args)
+        error_message = f"{error_abi['name']}({', '.join(map(str, error_decoded))})"
+        return error_message
 
     return f"Unknown error({error_data})"
 